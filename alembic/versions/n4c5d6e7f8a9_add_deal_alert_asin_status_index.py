@@ -0,0 +1,23 @@
+"""Add composite (amazon_asin, status) index on deal_alerts.
+
+Revision ID: n4c5d6e7f8a9
+Revises: m3b4c5d6e7f8
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "n4c5d6e7f8a9"
+down_revision = "m3b4c5d6e7f8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("deal_alerts") as batch_op:
+        batch_op.create_index("ix_deal_alerts_asin_status", ["amazon_asin", "status"])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("deal_alerts") as batch_op:
+        batch_op.drop_index("ix_deal_alerts_asin_status")
@@ -3,15 +3,16 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import threading
 import time
-from functools import partial
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from io import BytesIO
 from typing import Any
 
-from sp_api.api import CatalogItems, Feeds, ListingsItems, ListingsRestrictions, Orders, ProductFees
-from sp_api.base import Marketplaces, SellingApiException
+import orjson
 
 from ..config import settings
 from . import AmazonApiError
@@ -19,6 +20,24 @@ from . import AmazonApiError
 logger = logging.getLogger(__name__)
 
 
+@cache
+def _sp_api_class(name: str) -> type:
+    """Resolve an ``sp_api.api`` class by name.
+
+    sp_api pulls in boto3/cryptography and costs ~100 ms to import, so it is
+    only loaded once an SpApiClient actually talks to Amazon.
+    """
+    import sp_api.api
+
+    return getattr(sp_api.api, name)
+
+
+def _selling_api_exception() -> type[Exception]:
+    from sp_api.base import SellingApiException
+
+    return SellingApiException
+
+
 class SpApiClient:
     """Thin async wrapper around python-amazon-sp-api."""
 
@@ -31,67 +50,68 @@ class SpApiClient:
             "aws_secret_key": settings.sp_api_aws_secret_key,
             "role_arn": settings.sp_api_role_arn,
         }
+        from sp_api.base import Marketplaces
+
         self._marketplace = Marketplaces.JP
         self._marketplace_id = settings.sp_api_marketplace
-        self._fee_cache: dict[str, float] = {}  # ASIN → referral fee %
+        self._fee_cache: OrderedDict[str, float] = OrderedDict()  # ASIN → referral fee % (LRU)
         self._fee_cache_max: int = 200
+        self._product_type_cache: OrderedDict[str, str] = OrderedDict()  # ASIN → productType (LRU)
+        self._product_type_cache_max: int = 10_000
         self._last_fee_request_at: float = 0.0
         self._fee_quota_exhausted: bool = False  # Skip fee calls after QuotaExceeded
+        # Dedicated pool for the blocking sp_api calls (the default executor is
+        # capped at cpu_count+4 and shared with everything else)
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.sp_api_pool_size, thread_name_prefix="spapi",
+        )
+        self._thread_apis = threading.local()  # see _api()
+
+    async def close(self) -> None:
+        """Shut down the SP-API worker threads."""
+        self._executor.shutdown(wait=False)
 
     def reset_fee_quota(self) -> None:
         """Reset the QuotaExceeded flag at the start of each scan cycle."""
         self._fee_quota_exhausted = False
 
-    async def _call(self, fn: Any, *args: Any, **kwargs: Any) -> Any:
-        loop = asyncio.get_running_loop()
-        try:
-            result = await loop.run_in_executor(None, partial(fn, *args, **kwargs))
-            return result.payload
-        except SellingApiException as e:
-            raise AmazonApiError(str(e), getattr(e, "status_code", None)) from e
+    def _api(self, api_cls: type | str) -> Any:
+        """Return this worker thread's cached sp_api client of ``api_cls``.
 
-    def _catalog_api(self) -> CatalogItems:
-        return CatalogItems(
-            credentials=self._credentials,
-            marketplace=self._marketplace,
-        )
-
-    def _listings_api(self) -> ListingsItems:
-        return ListingsItems(
-            credentials=self._credentials,
-            marketplace=self._marketplace,
-        )
+        ``api_cls`` is an ``sp_api.api`` class or its name (e.g. "Orders").
 
-    def _restrictions_api(self) -> ListingsRestrictions:
-        return ListingsRestrictions(
-            credentials=self._credentials,
-            marketplace=self._marketplace,
-        )
-
-    def _fees_api(self) -> ProductFees:
-        return ProductFees(
-            credentials=self._credentials,
-            marketplace=self._marketplace,
-        )
+        Building a client opens fresh httpx connections, so each is reused
+        across calls.  Instances keep per-request state (``method``), so
+        they are cached per executor thread rather than shared.
+        """
+        name = api_cls if isinstance(api_cls, str) else api_cls.__name__
+        api = getattr(self._thread_apis, name, None)
+        if api is None:
+            cls = _sp_api_class(api_cls) if isinstance(api_cls, str) else api_cls
+            api = cls(credentials=self._credentials, marketplace=self._marketplace)
+            setattr(self._thread_apis, name, api)
+        return api
+
+    async def _run(self, api_cls: type | str, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Run ``api_cls.method(*args, **kwargs)`` on the SP-API thread pool."""
+        def _invoke() -> Any:
+            return getattr(self._api(api_cls), method)(*args, **kwargs)
 
-    def _feeds_api(self) -> Feeds:
-        return Feeds(
-            credentials=self._credentials,
-            marketplace=self._marketplace,
-        )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _invoke)
 
-    def _orders_api(self) -> Orders:
-        return Orders(
-            credentials=self._credentials,
-            marketplace=self._marketplace,
-        )
+    async def _call(self, api_cls: type | str, method: str, *args: Any, **kwargs: Any) -> Any:
+        try:
+            result = await self._run(api_cls, method, *args, **kwargs)
+            return result.payload
+        except _selling_api_exception() as e:
+            raise AmazonApiError(str(e), getattr(e, "status_code", None)) from e
 
     # --- Orders ---
 
     async def get_order_items(self, order_id: str) -> list[dict]:
         """Get line items for a specific order (includes SKU, ASIN, title, price)."""
-        api = self._orders_api()
-        result = await self._call(api.get_order_items, order_id)
+        result = await self._call("Orders", "get_order_items", order_id)
         return result.get("OrderItems", []) if isinstance(result, dict) else []
 
     async def get_new_orders(self, created_after: str) -> list[dict]:
@@ -99,9 +119,8 @@ class SpApiClient:
 
         Returns a list of order dicts with OrderStatus='Unshipped'.
         """
-        api = self._orders_api()
         result = await self._call(
-            api.get_orders,
+            "Orders", "get_orders",
             CreatedAfter=created_after,
             MarketplaceIds=[self._marketplace_id],
             OrderStatuses=["Unshipped"],
@@ -111,9 +130,8 @@ class SpApiClient:
     # --- Catalog ---
 
     async def get_catalog_item(self, asin: str) -> dict:
-        api = self._catalog_api()
         return await self._call(
-            api.get_catalog_item,
+            "CatalogItems", "get_catalog_item",
             asin=asin,
             marketplaceIds=[self._marketplace_id],
             includedData=["summaries", "images", "salesRanks"],
@@ -121,9 +139,8 @@ class SpApiClient:
 
     async def get_catalog_item_with_variations(self, asin: str) -> dict:
         """Get catalog item with relationships and images for variation lookup."""
-        api = self._catalog_api()
         return await self._call(
-            api.get_catalog_item,
+            "CatalogItems", "get_catalog_item",
             asin=asin,
             marketplaceIds=[self._marketplace_id],
             includedData=["summaries", "images", "relationships"],
@@ -132,29 +149,38 @@ class SpApiClient:
     async def get_product_type(self, asin: str) -> str:
         """Get the Amazon product type for an ASIN (e.g. 'SPACE_HEATER').
 
+        Successful lookups are cached (productType is stable per ASIN).
         Falls back to 'PRODUCT' if lookup fails.
         """
+        if asin in self._product_type_cache:
+            self._product_type_cache.move_to_end(asin)
+            return self._product_type_cache[asin]
         try:
-            api = self._catalog_api()
             result = await self._call(
-                api.get_catalog_item,
+                "CatalogItems", "get_catalog_item",
                 asin=asin,
                 marketplaceIds=[self._marketplace_id],
                 includedData=["productTypes"],
             )
-            product_types = result.get("productTypes", []) if isinstance(result, dict) else []
-            for pt in product_types:
-                if pt.get("productType"):
-                    logger.debug("ASIN %s productType: %s", asin, pt["productType"])
-                    return pt["productType"]
         except AmazonApiError as e:
             logger.warning("Failed to get productType for ASIN %s: %s", asin, e)
-        return "PRODUCT"
+            return "PRODUCT"  # not cached: retry on the next listing
+
+        product_type = "PRODUCT"
+        product_types = result.get("productTypes", []) if isinstance(result, dict) else []
+        for pt in product_types:
+            if pt.get("productType"):
+                logger.debug("ASIN %s productType: %s", asin, pt["productType"])
+                product_type = pt["productType"]
+                break
+        self._product_type_cache[asin] = product_type
+        if len(self._product_type_cache) > self._product_type_cache_max:
+            self._product_type_cache.popitem(last=False)
+        return product_type
 
     async def search_catalog_items(self, keywords: str, page_size: int = 10) -> list[dict]:
-        api = self._catalog_api()
         result = await self._call(
-            api.search_catalog_items,
+            "CatalogItems", "search_catalog_items",
             keywords=keywords,
             marketplaceIds=[self._marketplace_id],
             includedData=["summaries", "images"],
@@ -168,23 +194,18 @@ class SpApiClient:
         self, seller_id: str, sku: str, product_type: str, attributes: dict,
         *, offer_only: bool = False,
     ) -> dict:
-        api = self._listings_api()
         body = {"productType": product_type, "attributes": attributes}
         if offer_only:
             body["requirements"] = "LISTING_OFFER_ONLY"
-        loop = asyncio.get_running_loop()
         try:
-            result = await loop.run_in_executor(
-                None,
-                partial(
-                    api.put_listings_item,
-                    sellerId=seller_id,
-                    sku=sku,
-                    marketplaceIds=[self._marketplace_id],
-                    body=body,
-                ),
+            result = await self._run(
+                "ListingsItems", "put_listings_item",
+                sellerId=seller_id,
+                sku=sku,
+                marketplaceIds=[self._marketplace_id],
+                body=body,
             )
-        except SellingApiException as e:
+        except _selling_api_exception() as e:
             raise AmazonApiError(str(e), getattr(e, "status_code", None)) from e
 
         payload = result.payload if hasattr(result, "payload") else result or {}
@@ -204,97 +225,114 @@ class SpApiClient:
 
 
     async def patch_listing_quantity(self, seller_id: str, sku: str, quantity: int) -> dict:
-        api = self._listings_api()
-        body = {
-            "productType": "PRODUCT",
-            "patches": [{
-                "op": "replace",
-                "path": "/attributes/fulfillment_availability",
-                "value": [{"fulfillment_channel_code": "DEFAULT", "quantity": quantity}],
-            }],
-        }
-        return await self._call(
-            api.patch_listings_item,
-            sellerId=seller_id, sku=sku,
-            marketplaceIds=[self._marketplace_id], body=body,
-        )
+        return await self.patch_listing_bulk(seller_id, sku, [self.quantity_patch(quantity)])
 
     async def patch_listing_price(self, seller_id: str, sku: str, price_jpy: int) -> dict:
-        api = self._listings_api()
-        body = {
-            "productType": "PRODUCT",
-            "patches": [{
-                "op": "replace",
-                "path": "/attributes/purchasable_offer",
-                "value": [{
-                    "marketplace_id": self._marketplace_id,
-                    "currency": "JPY",
-                    "our_price": [{"schedule": [{"value_with_tax": price_jpy}]}],
-                }],
-            }],
-        }
-        return await self._call(
-            api.patch_listings_item,
-            sellerId=seller_id, sku=sku,
-            marketplaceIds=[self._marketplace_id], body=body,
-        )
+        return await self.patch_listing_bulk(seller_id, sku, [self.price_patch(price_jpy)])
 
     async def patch_listing_lead_time(self, seller_id: str, sku: str, days: int) -> dict:
-        api = self._listings_api()
-        body = {
-            "productType": "PRODUCT",
-            "patches": [{
-                "op": "replace",
-                "path": "/attributes/lead_time_to_ship_max_days",
-                "value": [{"value": days}],
-            }],
-        }
+        return await self.patch_listing_bulk(seller_id, sku, [self.lead_time_patch(days)])
+
+    async def patch_listing_shipping_group(self, seller_id: str, sku: str, group_name: str) -> dict:
+        return await self.patch_listing_bulk(seller_id, sku, [self.shipping_group_patch(group_name)])
+
+    async def patch_listing_all(
+        self, seller_id: str, sku: str, *,
+        quantity: int | None = None,
+        price_jpy: int | None = None,
+        lead_time: int | None = None,
+        shipping_group: str | None = None,
+    ) -> dict:
+        """PATCH any of quantity/price/lead time/shipping group in one request.
+
+        Only the fields that are not None are sent.  All operations share a
+        single patches array, so this costs one ListingsItems rate-limit token
+        instead of one per attribute.
+        """
+        patches = []
+        if quantity is not None:
+            patches.append(self.quantity_patch(quantity))
+        if price_jpy is not None:
+            patches.append(self.price_patch(price_jpy))
+        if lead_time is not None:
+            patches.append(self.lead_time_patch(lead_time))
+        if shipping_group is not None:
+            patches.append(self.shipping_group_patch(shipping_group))
+        return await self.patch_listing_bulk(seller_id, sku, patches)
+
+    async def patch_listing_bulk(self, seller_id: str, sku: str, patches: list[dict]) -> dict:
+        """Apply pre-built patch operations to one SKU in a single request."""
+        if not patches:
+            return {}
+        body = {"productType": "PRODUCT", "patches": patches}
         return await self._call(
-            api.patch_listings_item,
+            "ListingsItems", "patch_listings_item",
             sellerId=seller_id, sku=sku,
             marketplaceIds=[self._marketplace_id], body=body,
         )
 
-    async def patch_listing_shipping_group(self, seller_id: str, sku: str, group_name: str) -> dict:
-        api = self._listings_api()
-        body = {
-            "productType": "PRODUCT",
-            "patches": [{
-                "op": "replace",
-                "path": "/attributes/merchant_shipping_group",
-                "value": [{"value": group_name}],
+    @staticmethod
+    def quantity_patch(quantity: int) -> dict:
+        return {
+            "op": "replace",
+            "path": "/attributes/fulfillment_availability",
+            "value": [{"fulfillment_channel_code": "DEFAULT", "quantity": quantity}],
+        }
+
+    def price_patch(self, price_jpy: int) -> dict:
+        return {
+            "op": "replace",
+            "path": "/attributes/purchasable_offer",
+            "value": [{
+                "marketplace_id": self._marketplace_id,
+                "currency": "JPY",
+                "our_price": [{"schedule": [{"value_with_tax": price_jpy}]}],
             }],
         }
-        return await self._call(
-            api.patch_listings_item,
-            sellerId=seller_id, sku=sku,
-            marketplaceIds=[self._marketplace_id], body=body,
-        )
+
+    @staticmethod
+    def lead_time_patch(days: int) -> dict:
+        return {
+            "op": "replace",
+            "path": "/attributes/lead_time_to_ship_max_days",
+            "value": [{"value": days}],
+        }
+
+    @staticmethod
+    def shipping_group_patch(group_name: str) -> dict:
+        return {
+            "op": "replace",
+            "path": "/attributes/merchant_shipping_group",
+            "value": [{"value": group_name}],
+        }
 
     async def patch_condition_note(
         self, seller_id: str, sku: str, condition_note: str,
     ) -> dict:
         """PATCH condition_note (提供条件に関する注記) onto an existing listing."""
-        api = self._listings_api()
-        body = {
-            "productType": "PRODUCT",
-            "patches": [{
-                "op": "replace",
-                "path": "/attributes/condition_note",
-                "value": [{"value": condition_note, "language_tag": "ja_JP"}],
-            }],
-        }
-        return await self._call(
-            api.patch_listings_item,
-            sellerId=seller_id, sku=sku,
-            marketplaceIds=[self._marketplace_id], body=body,
+        return await self.patch_listing_bulk(
+            seller_id, sku, [self.condition_note_patch(condition_note)],
         )
 
     async def patch_offer_images(
         self, seller_id: str, sku: str, image_urls: list[str],
     ) -> dict:
         """PATCH offer-level images onto an existing listing."""
-        api = self._listings_api()
+        return await self.patch_listing_bulk(
+            seller_id, sku, self.offer_image_patches(image_urls),
+        )
+
+    @staticmethod
+    def condition_note_patch(condition_note: str) -> dict:
+        return {
+            "op": "replace",
+            "path": "/attributes/condition_note",
+            "value": [{"value": condition_note, "language_tag": "ja_JP"}],
+        }
+
+    @staticmethod
+    def offer_image_patches(image_urls: list[str]) -> list[dict]:
+        """Main image + up to 5 other offer images."""
         patches = []
         if image_urls:
             patches.append({
@@ -308,14 +346,7 @@ class SpApiClient:
                 "path": f"/attributes/other_offer_image_locator_{i + 1}",
                 "value": [{"media_location": url}],
             })
-        if not patches:
-            return {}
-        body = {"productType": "PRODUCT", "patches": patches}
-        return await self._call(
-            api.patch_listings_item,
-            sellerId=seller_id, sku=sku,
-            marketplaceIds=[self._marketplace_id], body=body,
-        )
+        return patches
 
     # --- Feeds API (price & inventory sync to Seller Central) ---
     # XML feeds (POST_PRODUCT_PRICING_DATA等) は403で使用不可。
@@ -323,87 +354,99 @@ class SpApiClient:
 
     async def submit_price_feed(self, seller_id: str, sku: str, price_jpy: int) -> dict:
         """Submit a JSON_LISTINGS_FEED to update price in Seller Central."""
-        feed_data = {
-            "header": {
-                "sellerId": seller_id,
-                "version": "2.0",
-                "issueLocale": "ja_JP",
-            },
-            "messages": [{
-                "messageId": 1,
-                "sku": sku,
-                "operationType": "PATCH",
-                "productType": "PRODUCT",
-                "patches": [{
-                    "op": "replace",
-                    "path": "/attributes/purchasable_offer",
-                    "value": [{
-                        "marketplace_id": self._marketplace_id,
-                        "currency": "JPY",
-                        "our_price": [{"schedule": [{"value_with_tax": price_jpy}]}],
-                    }],
-                }],
-            }],
-        }
-        return await self._submit_json_feed(feed_data)
+        return await self.submit_price_feed_batch(seller_id, [(sku, price_jpy)])
+
+    async def submit_price_feed_batch(
+        self, seller_id: str, updates: list[tuple[str, int]],
+    ) -> dict:
+        """Update prices for many SKUs in one feed ((sku, price_jpy) pairs)."""
+        return await self._submit_json_feed(self._listings_feed(seller_id, [
+            (sku, self.price_patch(price_jpy))
+            for sku, price_jpy in updates
+        ]))
 
     async def submit_inventory_feed(self, seller_id: str, sku: str, quantity: int, lead_time: int = 4) -> dict:
         """Submit a JSON_LISTINGS_FEED to update inventory in Seller Central."""
-        feed_data = {
+        return await self.submit_inventory_feed_batch(seller_id, [(sku, quantity)])
+
+    async def submit_inventory_feed_batch(
+        self, seller_id: str, updates: list[tuple[str, int]],
+    ) -> dict:
+        """Update quantities for many SKUs in one feed ((sku, quantity) pairs)."""
+        return await self._submit_json_feed(self._listings_feed(seller_id, [
+            (sku, self.quantity_patch(quantity))
+            for sku, quantity in updates
+        ]))
+
+    @staticmethod
+    def _listings_feed(seller_id: str, sku_patches: list[tuple[str, dict]]) -> dict:
+        """Build a JSON_LISTINGS_FEED body with one PATCH message per (sku, patch)."""
+        return {
             "header": {
                 "sellerId": seller_id,
                 "version": "2.0",
                 "issueLocale": "ja_JP",
             },
-            "messages": [{
-                "messageId": 1,
-                "sku": sku,
-                "operationType": "PATCH",
-                "productType": "PRODUCT",
-                "patches": [{
-                    "op": "replace",
-                    "path": "/attributes/fulfillment_availability",
-                    "value": [{
-                        "fulfillment_channel_code": "DEFAULT",
-                        "quantity": quantity,
-                    }],
-                }],
-            }],
+            "messages": [
+                {
+                    "messageId": i,
+                    "sku": sku,
+                    "operationType": "PATCH",
+                    "productType": "PRODUCT",
+                    "patches": [patch],
+                }
+                for i, (sku, patch) in enumerate(sku_patches, start=1)
+            ],
         }
-        return await self._submit_json_feed(feed_data)
 
     async def _submit_json_feed(self, feed_data: dict) -> dict:
         """Submit a JSON_LISTINGS_FEED via Feeds API."""
-        body = json.dumps(feed_data, ensure_ascii=False).encode("utf-8")
-        api = self._feeds_api()
-        loop = asyncio.get_running_loop()
+        body = orjson.dumps(feed_data)
         try:
-            doc_response, feed_response = await loop.run_in_executor(
-                None,
-                partial(
-                    api.submit_feed,
-                    "JSON_LISTINGS_FEED",
-                    BytesIO(body),
-                    content_type="application/json; charset=UTF-8",
-                    marketplaceIds=[self._marketplace_id],
-                ),
+            doc_response, feed_response = await self._run(
+                "Feeds", "submit_feed",
+                "JSON_LISTINGS_FEED",
+                BytesIO(body),
+                content_type="application/json; charset=UTF-8",
+                marketplaceIds=[self._marketplace_id],
             )
             return feed_response.payload
-        except SellingApiException as e:
+        except _selling_api_exception() as e:
             raise AmazonApiError(str(e), getattr(e, "status_code", None)) from e
 
     async def get_listing(self, seller_id: str, sku: str) -> dict:
-        api = self._listings_api()
         return await self._call(
-            api.get_listings_item,
+            "ListingsItems", "get_listings_item",
             sellerId=seller_id, sku=sku,
             marketplaceIds=[self._marketplace_id],
         )
 
+    async def get_listings_bulk(self, seller_id: str, skus: list[str]) -> dict[str, dict | None]:
+        """Fetch up to 20 listings in one searchListingsItems call.
+
+        Returns {sku: listing} for every requested SKU; SKUs missing from the
+        response map to None (same meaning as a 404 from get_listing).
+        """
+        if not skus:
+            return {}
+        result = await self._call(
+            "ListingsItems", "search_listings_items",
+            sellerId=seller_id,
+            marketplaceIds=[self._marketplace_id],
+            identifiers=",".join(skus),
+            identifiersType="SKU",
+            pageSize=len(skus),
+        )
+        found = {
+            listing["sku"]: listing
+            for listing in (result.get("items", []) if isinstance(result, dict) else [])
+            if listing.get("sku")
+        }
+        return {sku: found.get(sku) for sku in skus}
+
     async def delete_listing(self, seller_id: str, sku: str) -> dict:
-        api = self._listings_api()
         return await self._call(
-            api.delete_listings_item,
+            "ListingsItems", "delete_listings_item",
             sellerId=seller_id, sku=sku,
             marketplaceIds=[self._marketplace_id],
         )
@@ -418,10 +461,9 @@ class SpApiClient:
         Returns a list of restriction objects. Empty list = no restrictions (listable).
         Each restriction has: conditionType, reasons[{reasonCode, message, links}].
         """
-        api = self._restrictions_api()
         try:
             result = await self._call(
-                api.get_listings_restrictions,
+                "ListingsRestrictions", "get_listings_restrictions",
                 asin=asin,
                 sellerId=settings.sp_api_seller_id,
                 marketplaceIds=[self._marketplace_id],
@@ -442,12 +484,13 @@ class SpApiClient:
     async def get_referral_fee_pct(self, asin: str, price: int) -> float | None:
         """Get Amazon referral fee percentage for an ASIN.
 
-        Uses an in-memory cache (fee % is category-dependent and stable).
+        Uses an in-memory LRU cache (fee % is category-dependent and stable).
         Rate-limited to 1 request/second per SP-API constraints.
 
         Returns the fee percentage (e.g. 15.0 for 15%), or None on error.
         """
         if asin in self._fee_cache:
+            self._fee_cache.move_to_end(asin)
             return self._fee_cache[asin]
 
         if price <= 0 or self._fee_quota_exhausted:
@@ -460,10 +503,9 @@ class SpApiClient:
             await asyncio.sleep(1.0 - elapsed)
 
         try:
-            api = self._fees_api()
             self._last_fee_request_at = time.monotonic()
             result = await self._call(
-                api.get_product_fees_estimate_for_asin,
+                "ProductFees", "get_product_fees_estimate_for_asin",
                 asin=asin,
                 price=float(price),
                 currency="JPY",
@@ -484,9 +526,9 @@ class SpApiClient:
                 if fee.get("FeeType") == "ReferralFee":
                     fee_amount = float(fee["FeeAmount"]["Amount"])
                     fee_pct = round(fee_amount / price * 100, 1)
-                    if len(self._fee_cache) >= self._fee_cache_max:
-                        self._fee_cache.clear()
                     self._fee_cache[asin] = fee_pct
+                    if len(self._fee_cache) > self._fee_cache_max:
+                        self._fee_cache.popitem(last=False)  # evict least recently used
                     logger.debug(
                         "ASIN %s referral fee: %.1f%% (¥%d on ¥%d)",
                         asin, fee_pct, fee_amount, price,
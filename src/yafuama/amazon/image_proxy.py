@@ -5,7 +5,8 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import logging
-from functools import partial
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from typing import Any
 
@@ -16,32 +17,133 @@ from ..config import settings
 logger = logging.getLogger(__name__)
 
 _s3_client: Any = None
+# Reused across listings so Yahoo CDN downloads keep their pooled connections
+_http_client: httpx.AsyncClient | None = None
+# boto3 uploads run here instead of the small shared default executor
+_upload_executor: ThreadPoolExecutor | None = None
+# Caps in-flight downloads/uploads across all listings (image_proxy_concurrency)
+_proxy_semaphore: asyncio.Semaphore | None = None
+# Yahoo image URL → uploaded S3 URL, so relisted/reused images skip GET + PUT
+_uploaded_urls: OrderedDict[str, str] = OrderedDict()
+_UPLOADED_URLS_MAX = 5000
+_MULTIPART_THRESHOLD = 8 * 1024 * 1024
 
 
 def _get_s3_client():
     global _s3_client
     if _s3_client is None:
         import boto3
+        from botocore.config import Config
 
         _s3_client = boto3.client(
             "s3",
             region_name=settings.s3_image_region,
             aws_access_key_id=settings.sp_api_aws_access_key,
             aws_secret_access_key=settings.sp_api_aws_secret_key,
+            # Keep a pooled keep-alive connection for every upload thread
+            config=Config(
+                max_pool_connections=max(10, settings.image_proxy_concurrency),
+                tcp_keepalive=True,
+                retries={"mode": "adaptive", "max_attempts": 3},
+            ),
         )
     return _s3_client
 
 
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=15.0,
+            headers={"User-Agent": settings.scraper_user_agent},
+            # One keep-alive socket per concurrent download (see image_proxy_concurrency)
+            limits=httpx.Limits(
+                max_keepalive_connections=max(1, settings.image_proxy_concurrency),
+                keepalive_expiry=60,
+            ),
+        )
+    return _http_client
+
+
+def _get_upload_executor() -> ThreadPoolExecutor:
+    global _upload_executor
+    if _upload_executor is None:
+        _upload_executor = ThreadPoolExecutor(
+            max_workers=max(1, settings.image_proxy_concurrency),
+            thread_name_prefix="s3upload",
+        )
+    return _upload_executor
+
+
+def _get_proxy_semaphore() -> asyncio.Semaphore:
+    global _proxy_semaphore
+    if _proxy_semaphore is None:
+        _proxy_semaphore = asyncio.Semaphore(max(1, settings.image_proxy_concurrency))
+    return _proxy_semaphore
+
+
+async def close_image_proxy_client() -> None:
+    """Close the shared download client and upload pool (called on app shutdown)."""
+    global _http_client, _upload_executor, _proxy_semaphore
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+    if _upload_executor is not None:
+        _upload_executor.shutdown(wait=False)
+        _upload_executor = None
+    _proxy_semaphore = None
+
+
+def _detect_image_type(data: bytes, header_ct: str) -> tuple[str, str]:
+    """Return (extension, content type) from the image's magic bytes.
+
+    Falls back to the Content-Type header for formats not recognized here.
+    """
+    if data.startswith(b"\xff\xd8\xff"):
+        return "jpg", "image/jpeg"
+    if data.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png", "image/png"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "webp", "image/webp"
+    if "png" in header_ct:
+        return "png", header_ct
+    if "webp" in header_ct:
+        return "webp", header_ct
+    return "jpg", header_ct
+
+
 def _upload_to_s3(image_bytes: bytes, key: str, content_type: str) -> str:
-    """Upload image bytes to S3 and return the public URL."""
+    """Upload image bytes to S3 and return the public URL.
+
+    Typical gallery images go up in a single PUT; unusually large ones use
+    the transfer manager so their multipart parts upload in parallel.
+    """
     client = _get_s3_client()
-    client.put_object(
-        Bucket=settings.s3_image_bucket,
-        Key=key,
-        Body=image_bytes,
-        ContentType=content_type,
-        CacheControl="public, max-age=2592000",  # 30 days
-    )
+    extra_args = {
+        "ContentType": content_type,
+        "CacheControl": "public, max-age=2592000",  # 30 days
+    }
+    if len(image_bytes) >= _MULTIPART_THRESHOLD:
+        from boto3.s3.transfer import TransferConfig
+
+        client.upload_fileobj(
+            BytesIO(image_bytes),
+            settings.s3_image_bucket,
+            key,
+            ExtraArgs=extra_args,
+            Config=TransferConfig(
+                multipart_threshold=_MULTIPART_THRESHOLD,
+                multipart_chunksize=_MULTIPART_THRESHOLD,
+                max_concurrency=4,
+            ),
+        )
+    else:
+        client.put_object(
+            Bucket=settings.s3_image_bucket,
+            Key=key,
+            Body=image_bytes,
+            **extra_args,
+        )
     return f"https://{settings.s3_image_bucket}.s3.{settings.s3_image_region}.amazonaws.com/{key}"
 
 
@@ -60,46 +162,62 @@ async def upload_images_to_s3(
     if not image_urls:
         return []
 
-    s3_urls: list[str] = []
-    loop = asyncio.get_running_loop()
-
-    async with httpx.AsyncClient(
-        timeout=15.0,
-        headers={"User-Agent": settings.scraper_user_agent},
-    ) as http:
-        for i, url in enumerate(image_urls):
-            try:
-                resp = await http.get(url)
-                resp.raise_for_status()
-                image_bytes = resp.content
-
-                # Determine content type
-                ct = resp.headers.get("content-type", "image/jpeg")
-                ext = "jpg"
-                if "png" in ct:
-                    ext = "png"
-                elif "webp" in ct:
-                    ext = "webp"
-
-                # Unique key: auction_id + image index + content hash
-                content_hash = hashlib.md5(image_bytes).hexdigest()[:8]
-                key = f"offer-images/{auction_id}/{i:02d}_{content_hash}.{ext}"
-
-                # Upload (blocking boto3 call in executor)
-                s3_url = await loop.run_in_executor(
-                    None,
-                    partial(_upload_to_s3, image_bytes, key, ct),
-                )
-                s3_urls.append(s3_url)
-                logger.debug("Uploaded image %d for %s → %s", i, auction_id, s3_url)
-
-            except Exception as e:
-                logger.error(
-                    "Failed to proxy image %d for %s: %s — using original URL",
-                    i, auction_id, e,
-                )
-                # Fallback: use original Yahoo URL
-                s3_urls.append(url)
+    http = _get_http_client()
+    executor = _get_upload_executor()
+    # Bound in-flight work (shared by concurrent listings) so large galleries
+    # don't flood the CDN / boto3 pool
+    sem = _get_proxy_semaphore()
+
+    async def _download_and_upload(i: int, url: str) -> str:
+        resp = await http.get(url)
+        resp.raise_for_status()
+        image_bytes = resp.content
+
+        # Determine content type from the bytes (CDN headers are unreliable)
+        ext, ct = _detect_image_type(
+            image_bytes, resp.headers.get("content-type", "image/jpeg"),
+        )
+
+        # Unique key: auction_id + image index + content hash (a key, not security)
+        content_hash = hashlib.md5(image_bytes, usedforsecurity=False).hexdigest()[:8]
+        key = f"offer-images/{auction_id}/{i:02d}_{content_hash}.{ext}"
+
+        # Upload (blocking boto3 call on the upload pool)
+        s3_url = await asyncio.wrap_future(
+            executor.submit(_upload_to_s3, image_bytes, key, ct),
+        )
+        logger.debug("Uploaded image %d for %s → %s", i, auction_id, s3_url)
+        return s3_url
+
+    async def _proxy_one(i: int, url: str) -> str:
+        cached = _uploaded_urls.get(url)
+        if cached is not None:
+            _uploaded_urls.move_to_end(url)
+            return cached
+        try:
+            async with sem:
+                s3_url = await _download_and_upload(i, url)
+            _uploaded_urls[url] = s3_url
+            if len(_uploaded_urls) > _UPLOADED_URLS_MAX:
+                _uploaded_urls.popitem(last=False)
+            return s3_url
+        except Exception as e:
+            logger.error(
+                "Failed to proxy image %d for %s: %s — using original URL",
+                i, auction_id, e,
+            )
+            # Fallback: use original Yahoo URL
+            return url
+
+    # Proxy each distinct URL once (galleries repeat placeholders/photos),
+    # overlapping all downloads/uploads, then map back to input order
+    first_index: dict[str, int] = {}
+    for i, url in enumerate(image_urls):
+        first_index.setdefault(url, i)
+    proxied = dict(zip(first_index, await asyncio.gather(
+        *(_proxy_one(i, url) for url, i in first_index.items())
+    )))
+    s3_urls = [proxied[url] for url in image_urls]
 
     logger.info(
         "Proxied %d/%d images for %s to S3",
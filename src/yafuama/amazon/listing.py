@@ -2,8 +2,8 @@
 
 All three listing code paths (list_from_deal, create_listing, relist_listing)
 funnel through submit_to_amazon() for the SP-API call sequence:
-  PUT → 3s wait → condition_note PATCH → image PATCH → price PATCH
-  → quantity PATCH → price Feed → inventory Feed
+  PUT → 3s wait → condition_note PATCH → image PATCH
+  → price + quantity PATCH → price Feed → inventory Feed
 
 This prevents PATCH omissions (e.g. condition_note not sent separately
 from PUT in LISTING_OFFER_ONLY mode).
@@ -117,6 +117,8 @@ async def submit_to_amazon(
     await asyncio.sleep(3)
 
     # --- 3. PATCH condition_note (LISTING_OFFER_ONLY ignores it in PUT) ---
+    # Kept in its own request: a rejected image locator would make a combined
+    # PATCH INVALID and silently drop the note.
     if params.condition_note:
         try:
             await sp_client.patch_condition_note(seller_id, sku, params.condition_note)
@@ -144,17 +146,26 @@ async def submit_to_amazon(
             logger.error("Offer image PATCH failed for %s: %s", sku, e)
 
     # --- 5. PATCH price + quantity (activation) ---
+    # One request normally; if it is rejected (an INVALID op fails the whole
+    # patch set), retry separately so a bad price can't drop the activation.
     try:
-        await sp_client.patch_listing_price(seller_id, sku, params.price)
-        logger.info("Price PATCH sent for %s (¥%d)", sku, params.price)
-    except AmazonApiError:
-        logger.warning("Price PATCH failed for %s", sku)
+        await sp_client.patch_listing_all(
+            seller_id, sku, price_jpy=params.price, quantity=1,
+        )
+        logger.info("Price + quantity PATCH sent for %s (¥%d)", sku, params.price)
+    except AmazonApiError as e:
+        logger.warning("Price + quantity PATCH failed for %s: %s — retrying separately", sku, e)
+        try:
+            await sp_client.patch_listing_price(seller_id, sku, params.price)
+            logger.info("Price PATCH sent for %s (¥%d)", sku, params.price)
+        except AmazonApiError:
+            logger.warning("Price PATCH failed for %s", sku)
 
-    try:
-        await sp_client.patch_listing_quantity(seller_id, sku, 1)
-        logger.info("Quantity PATCH sent for %s", sku)
-    except AmazonApiError:
-        logger.warning("Quantity PATCH failed for %s", sku)
+        try:
+            await sp_client.patch_listing_quantity(seller_id, sku, 1)
+            logger.info("Quantity PATCH sent for %s", sku)
+        except AmazonApiError:
+            logger.warning("Quantity PATCH failed for %s", sku)
 
     # --- 6. Feeds (Seller Central sync) ---
     try:
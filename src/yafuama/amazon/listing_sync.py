@@ -5,9 +5,12 @@ from __future__ import annotations
 import asyncio
 import logging
 import math
-from datetime import datetime, timezone
+import random
+from datetime import datetime, timedelta, timezone
+from time import monotonic
 
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, or_, update
+from sqlalchemy.orm import Session, load_only
 
 from ..config import settings
 from ..database import SessionLocal
@@ -17,6 +20,68 @@ from .client import SpApiClient
 
 logger = logging.getLogger(__name__)
 
+# searchListingsItems usage plan: 5 requests/second, burst 5; max 20 SKUs each
+_LISTING_RATE = 5.0
+_LISTING_BURST = 5
+_LISTING_BATCH = 20
+# Throttled (429/503) fetches back off exponentially, then retry
+_THROTTLE_STATUSES = (429, 503)
+_THROTTLE_RETRIES = 3
+_BACKOFF_BASE = 0.5
+_BACKOFF_MAX = 60.0
+
+
+class _TokenBucket:
+    """Async token bucket: ``acquire()`` waits until a request may be sent."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated_at = monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for ``seconds`` (e.g. after a 429)."""
+        self._paused_until = max(self._paused_until, monotonic() + seconds)
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            wait = self._paused_until - monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            now = monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._updated_at) * self._rate)
+            self._updated_at = now
+            if self._tokens < 1:
+                # Holding the lock while waiting keeps callers in FIFO order
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._tokens = 1.0
+                self._updated_at = monotonic()
+            self._tokens -= 1
+
+
+def _history_row(
+    item: MonitoredItem,
+    change_type: str,
+    *,
+    old_status: str | None = None,
+    new_status: str | None = None,
+    old_price: int | None = None,
+    new_price: int | None = None,
+) -> dict:
+    """StatusHistory insert params (same keys for every row, for executemany)."""
+    return {
+        "item_id": item.id,
+        "auction_id": item.auction_id,
+        "change_type": change_type,
+        "old_status": old_status,
+        "new_status": new_status,
+        "old_price": old_price,
+        "new_price": new_price,
+    }
+
 
 class ListingSyncChecker:
     """Periodically verify Amazon listings still exist and sync price changes.
@@ -33,15 +98,37 @@ class ListingSyncChecker:
         self.seller_id = settings.sp_api_seller_id
         # Track consecutive failures per SKU to avoid false positives
         self._fail_counts: dict[str, int] = {}
+        self._bucket = _TokenBucket(_LISTING_RATE, _LISTING_BURST)
+        self._consecutive_throttle = 0
 
     async def check_all(self) -> None:
         db: Session = SessionLocal()
         try:
+            fresh_cutoff = datetime.now(timezone.utc) - timedelta(
+                seconds=settings.listing_sync_fresh_seconds,
+            )
+            # Only the columns check_all/_sync_price read (MonitoredItem is wide)
             items = (
                 db.query(MonitoredItem)
+                .options(load_only(
+                    MonitoredItem.id,
+                    MonitoredItem.auction_id,
+                    MonitoredItem.amazon_sku,
+                    MonitoredItem.amazon_price,
+                    MonitoredItem.estimated_win_price,
+                    MonitoredItem.shipping_cost,
+                    MonitoredItem.forwarding_cost,
+                    MonitoredItem.amazon_fee_pct,
+                    MonitoredItem.amazon_margin_pct,
+                ))
                 .filter(
                     MonitoredItem.amazon_sku.isnot(None),
                     MonitoredItem.amazon_listing_status.in_(["active", "inactive"]),
+                    # Skip listings synced moments ago (price update, relist, ...)
+                    or_(
+                        MonitoredItem.amazon_last_synced_at.is_(None),
+                        MonitoredItem.amazon_last_synced_at < fresh_cutoff,
+                    ),
                 )
                 .all()
             )
@@ -51,8 +138,29 @@ class ListingSyncChecker:
             logger.info("Listing sync: checking %d Amazon listings", len(items))
             cleaned = 0
             price_synced = 0
+            # Pending writes, applied as executemany statements after the loop
+            # (one key set per list, so each list is a single UPDATE/INSERT)
+            delist_updates: list[dict] = []
+            price_updates: list[dict] = []
+            history: list[dict] = []
+            # Fetch concurrently, paced to the getListingsItem rate limit;
+            # DB updates below stay sequential on this session.
+            sem = asyncio.Semaphore(_LISTING_BURST)
+
+            async def _fetch(skus: list[str]) -> dict[str, dict | None]:
+                async with sem:
+                    return await self._fetch_listings(skus)
+
+            skus = [item.amazon_sku for item in items]
+            listings: dict[str, dict | None] = {}
+            for batch in await asyncio.gather(*(
+                _fetch(skus[i:i + _LISTING_BATCH])
+                for i in range(0, len(skus), _LISTING_BATCH)
+            )):
+                listings.update(batch)
+
             for item in items:
-                listing_data = await self._fetch_listing(item.amazon_sku)
+                listing_data = listings.get(item.amazon_sku, {})
 
                 if listing_data is None:
                     # Listing not found
@@ -66,12 +174,14 @@ class ListingSyncChecker:
                         )
                         old_sku = item.amazon_sku
                         # Keep amazon_sku for cross-reference — do NOT set to None
-                        item.amazon_listing_status = "delisted"
-                        item.amazon_last_synced_at = None
-                        item.updated_at = datetime.now(timezone.utc)
-                        db.add(StatusHistory(
-                            item_id=item.id, auction_id=item.auction_id,
-                            change_type="amazon_delist",
+                        delist_updates.append({
+                            "id": item.id,
+                            "amazon_listing_status": "delisted",
+                            "amazon_last_synced_at": None,
+                            "updated_at": datetime.now(timezone.utc),
+                        })
+                        history.append(_history_row(
+                            item, "amazon_delist",
                             old_status=old_sku,
                             new_status="セラーセントラルで削除検知",
                         ))
@@ -81,11 +191,16 @@ class ListingSyncChecker:
                     self._fail_counts.pop(item.amazon_sku, None)
 
                     # Check for price changes
-                    if self._sync_price(item, listing_data, db):
+                    if self._sync_price(item, listing_data, price_updates, history):
                         price_synced += 1
 
-                await asyncio.sleep(0.2)  # Rate limit protection
-
+            # ORM bulk UPDATE by primary key; items are not mutated, so the
+            # flush adds no per-row UPDATEs on top
+            for updates in (delist_updates, price_updates):
+                if updates:
+                    db.execute(update(MonitoredItem), updates)
+            if history:
+                db.execute(insert(StatusHistory), history)
             if cleaned or price_synced:
                 db.commit()
 
@@ -102,9 +217,17 @@ class ListingSyncChecker:
         finally:
             db.close()
 
-    def _sync_price(self, item: MonitoredItem, listing_data: dict, db: Session) -> bool:
+    def _sync_price(
+        self,
+        item: MonitoredItem,
+        listing_data: dict,
+        updates: list[dict],
+        history: list[dict],
+    ) -> bool:
         """Check if Amazon price differs from local DB and sync if needed.
 
+        Appends the MonitoredItem update params to ``updates`` and the
+        price_change StatusHistory row to ``history``; ``item`` is left as is.
         Returns True if a price change was detected and synced.
         """
         amazon_price = self._extract_price(listing_data)
@@ -117,7 +240,7 @@ class ListingSyncChecker:
 
         # Price changed on Seller Central — sync it
         old_price = local_price
-        item.amazon_price = amazon_price
+        new_margin = item.amazon_margin_pct
 
         # Recalculate profit margin based on new price
         cost = item.estimated_win_price + item.shipping_cost
@@ -130,14 +253,19 @@ class ListingSyncChecker:
             # Back-calculate: margin_pct = 1 - (cost / price) - fee_pct/100
             if amazon_price > 0:
                 actual_margin = (1.0 - cost / amazon_price - item.amazon_fee_pct / 100.0) * 100.0
-                item.amazon_margin_pct = round(actual_margin, 1)
+                new_margin = round(actual_margin, 1)
 
-        item.amazon_last_synced_at = datetime.now(timezone.utc)
-        item.updated_at = datetime.now(timezone.utc)
+        now = datetime.now(timezone.utc)
+        updates.append({
+            "id": item.id,
+            "amazon_price": amazon_price,
+            "amazon_margin_pct": new_margin,
+            "amazon_last_synced_at": now,
+            "updated_at": now,
+        })
 
-        db.add(StatusHistory(
-            item_id=item.id, auction_id=item.auction_id,
-            change_type="price_change",
+        history.append(_history_row(
+            item, "price_change",
             old_price=old_price,
             new_price=amazon_price,
             old_status="セラーセントラルで価格変更検知",
@@ -145,8 +273,7 @@ class ListingSyncChecker:
 
         logger.info(
             "Price sync: %s (SKU=%s) ¥%d → ¥%d (margin: %.1f%%)",
-            item.auction_id, item.amazon_sku, old_price, amazon_price,
-            item.amazon_margin_pct,
+            item.auction_id, item.amazon_sku, old_price, amazon_price, new_margin,
         )
         return True
 
@@ -178,15 +305,32 @@ class ListingSyncChecker:
 
         return None
 
-    async def _fetch_listing(self, sku: str) -> dict | None:
-        """Fetch listing data from Amazon. Returns None if not found."""
-        try:
-            result = await self.client.get_listing(self.seller_id, sku)
-            return result
-        except AmazonApiError as e:
-            status_code = getattr(e, "status_code", None)
-            if status_code == 404:
-                return None
-            # Other errors (throttling, 500, etc.) → treat as "exists" to be safe
-            logger.warning("Listing fetch error for SKU %s: %s", sku, e)
-            return {}  # Empty dict = exists but couldn't read details
+    async def _fetch_listings(self, skus: list[str]) -> dict[str, dict | None]:
+        """Fetch a batch of listings from Amazon. None = SKU not found.
+
+        Paced by the shared token bucket; 429/503 responses pause the whole
+        bucket with exponential backoff and the batch is retried.
+        """
+        for attempt in range(_THROTTLE_RETRIES + 1):
+            await self._bucket.acquire()
+            try:
+                result = await self.client.get_listings_bulk(self.seller_id, skus)
+                self._consecutive_throttle = 0
+                return result
+            except AmazonApiError as e:
+                status_code = getattr(e, "status_code", None)
+                if status_code in _THROTTLE_STATUSES and attempt < _THROTTLE_RETRIES:
+                    backoff = min(
+                        _BACKOFF_MAX, _BACKOFF_BASE * 2 ** self._consecutive_throttle,
+                    ) + random.uniform(0, 0.25)
+                    self._consecutive_throttle += 1
+                    self._bucket.pause(backoff)
+                    logger.info(
+                        "Listing fetch throttled for %d SKUs (%s) — backing off %.1fs",
+                        len(skus), status_code, backoff,
+                    )
+                    continue
+                # Other errors (500, retries exhausted, etc.) → treat as "exists" to be safe
+                logger.warning("Listing fetch error for %d SKUs (%s...): %s", len(skus), skus[0], e)
+                break
+        return {sku: {} for sku in skus}  # Empty dict = exists but couldn't read details
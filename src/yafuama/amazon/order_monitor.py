@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
 
@@ -26,6 +27,8 @@ _CHECKPOINT_KEY = "order_monitor_last_checked"
 # On first startup (no persisted checkpoint), look back this many seconds
 # so orders placed during a deploy/restart are not missed.
 _STARTUP_LOOKBACK_SECONDS = 600  # 10 minutes
+# Concurrent getOrderItems calls per poll (usage plan: 0.5 req/s, burst 30)
+_ORDER_ITEMS_CONCURRENCY = 5
 
 
 class OrderMonitor:
@@ -94,24 +97,20 @@ class OrderMonitor:
         )
         return fallback
 
-    def _save_checkpoint(self) -> None:
-        """Persist current checkpoint to DB."""
-        db = SessionLocal()
-        try:
-            db.execute(
-                text(
-                    "INSERT OR REPLACE INTO app_state (key, value, updated_at) "
-                    "VALUES (:k, :v, :ts)"
-                ),
-                {
-                    "k": _CHECKPOINT_KEY,
-                    "v": self._last_checked_at,
-                    "ts": datetime.now(timezone.utc).isoformat(),
-                },
-            )
-            db.commit()
-        finally:
-            db.close()
+    def _save_checkpoint(self, db: Session) -> None:
+        """Persist current checkpoint using the poll cycle's session."""
+        db.execute(
+            text(
+                "INSERT OR REPLACE INTO app_state (key, value, updated_at) "
+                "VALUES (:k, :v, :ts)"
+            ),
+            {
+                "k": _CHECKPOINT_KEY,
+                "v": self._last_checked_at,
+                "ts": datetime.now(timezone.utc).isoformat(),
+            },
+        )
+        db.commit()
 
     @staticmethod
     def _load_seen_order_ids() -> set[str]:
@@ -119,12 +118,12 @@ class OrderMonitor:
         db = SessionLocal()
         try:
             cutoff = datetime.now(timezone.utc) - timedelta(hours=48)
-            rows = (
-                db.query(AmazonOrder.amazon_order_id)
+            # Stream the IDs straight into the set instead of buffering a row list
+            seen = {
+                r[0] for r in db.query(AmazonOrder.amazon_order_id)
                 .filter(AmazonOrder.created_at > cutoff)
-                .all()
-            )
-            seen = {r[0] for r in rows}
+                .yield_per(1000)
+            }
             if seen:
                 logger.info("Order monitor: restored %d seen order IDs from DB", len(seen))
             return seen
@@ -156,22 +155,42 @@ class OrderMonitor:
             if o.get("AmazonOrderId") not in self._seen_order_ids
         ]
 
-        if not new_orders:
-            logger.debug("Order monitor: no new orders since %s", self._last_checked_at)
-            self._last_checked_at = now
-            self._save_checkpoint()
-            return
-
-        logger.info("Order monitor: %d new order(s) found", len(new_orders))
-
-        # Process each order — only mark as "seen" after successful notification
+        # One session per poll cycle: order records and the checkpoint
         db: Session = SessionLocal()
-        all_succeeded = True
         try:
-            for order in new_orders:
+            if not new_orders:
+                logger.debug("Order monitor: no new orders since %s", self._last_checked_at)
+                self._last_checked_at = now
+                self._save_checkpoint(db)
+                return
+
+            logger.info("Order monitor: %d new order(s) found", len(new_orders))
+
+            # Fetch every order's line items up front, then resolve all of them
+            # to MonitoredItems with two IN queries instead of one query per item
+            sem = asyncio.Semaphore(_ORDER_ITEMS_CONCURRENCY)
+
+            async def _items(order: dict) -> list[dict]:
+                async with sem:
+                    return await self._fetch_order_items(order)
+
+            order_items = await asyncio.gather(*(_items(o) for o in new_orders))
+
+            try:
+                by_sku, by_asin = self._load_monitored_items(db, order_items)
+            except Exception as e:
+                # Nothing is notified or marked seen: every order retries next cycle
+                logger.exception("Order monitor: failed to load ordered items: %s", e)
+                db.rollback()
+                return
+
+            # Process each order — only mark as "seen" after successful notification
+            all_succeeded = True
+            for order, items in zip(new_orders, order_items):
                 order_id = order.get("AmazonOrderId", "unknown")
                 try:
-                    success = await self._notify_order(order, db)
+                    product_info = self._lookup_product_info(items, by_sku, by_asin)
+                    success = await self._notify_order(order, db, product_info)
                     if success:
                         self._seen_order_ids.add(order_id)
                     else:
@@ -185,27 +204,30 @@ class OrderMonitor:
                     logger.exception(
                         "Order monitor: error processing order %s: %s", order_id, e,
                     )
+
+            # Only advance checkpoint if ALL orders were successfully notified.
+            # Failed orders will be re-fetched next cycle (not in _seen_order_ids).
+            if all_succeeded:
+                self._last_checked_at = now
+                self._save_checkpoint(db)
+            else:
+                logger.info(
+                    "Order monitor: checkpoint NOT advanced due to notification failures, "
+                    "will re-fetch on next cycle"
+                )
         finally:
             db.close()
 
-        # Only advance checkpoint if ALL orders were successfully notified.
-        # Failed orders will be re-fetched next cycle (not in _seen_order_ids).
-        if all_succeeded:
-            self._last_checked_at = now
-            self._save_checkpoint()
-        else:
-            logger.info(
-                "Order monitor: checkpoint NOT advanced due to notification failures, "
-                "will re-fetch on next cycle"
-            )
-
         # Prevent unbounded memory growth: keep only recent 500 order IDs
         if len(self._seen_order_ids) > 500:
             self._seen_order_ids = set(list(self._seen_order_ids)[-200:])
 
-    async def _notify_order(self, order: dict, db: Session) -> bool:
+    async def _notify_order(
+        self, order: dict, db: Session, product_info: dict | None,
+    ) -> bool:
         """Build and send a Discord notification for a single order.
 
+        ``product_info`` is the matched MonitoredItem (see _lookup_product_info).
         Returns True if the webhook was sent successfully.
         """
         order_id = order.get("AmazonOrderId", "unknown")
@@ -219,9 +241,6 @@ class OrderMonitor:
         # Build Seller Central link
         sc_url = SELLER_CENTRAL_ORDER_URL.format(order_id=order_id)
 
-        # Get SKU from getOrderItems API and match to MonitoredItem
-        product_info = await self._lookup_product_info(order, db)
-
         # Format the notification
         if self.webhook_type == "discord":
             payload = self._build_discord_payload(
@@ -364,53 +383,94 @@ class OrderMonitor:
             "embeds": embeds,
         }
 
-    async def _lookup_product_info(self, order: dict, db: Session) -> dict | None:
-        """Match order to MonitoredItem via getOrderItems API (SKU-based)."""
+    async def _fetch_order_items(self, order: dict) -> list[dict]:
+        """Get an order's line items via getOrderItems ([] on failure)."""
         order_id = order.get("AmazonOrderId", "")
         if not order_id:
-            return None
-
-        # Call getOrderItems to get SKU
+            return []
         try:
-            order_items = await self.client.get_order_items(order_id)
+            return await self.client.get_order_items(order_id)
         except AmazonApiError as e:
             logger.warning("Order monitor: getOrderItems failed for %s: %s", order_id, e)
-            order_items = []
+            return []
+        except Exception as e:
+            # Only this order loses its product info; the others still go out
+            logger.exception(
+                "Order monitor: unexpected getOrderItems error for %s: %s", order_id, e,
+            )
+            return []
 
-        # Try to match each order item's SKU to a MonitoredItem
+    @staticmethod
+    def _load_monitored_items(
+        db: Session, order_items: list[list[dict]],
+    ) -> tuple[dict[str, dict], dict[str, dict]]:
+        """Batch-load MonitoredItem fields for all order line items (by SKU, by ASIN).
+
+        One IN query per key type covers every order in the cycle. When several
+        items share a key, the lowest id wins.
+        """
+        skus = {oi.get("SellerSKU") for items in order_items for oi in items} - {None, ""}
+        asins = {oi.get("ASIN") for items in order_items for oi in items} - {None, ""}
+
+        by_sku: dict[str, dict] = {}
+        by_asin: dict[str, dict] = {}
+        for keys, column, found in (
+            (skus, MonitoredItem.amazon_sku, by_sku),
+            (asins, MonitoredItem.amazon_asin, by_asin),
+        ):
+            if not keys:
+                continue
+            for item in (
+                db.query(MonitoredItem).filter(column.in_(keys)).order_by(MonitoredItem.id)
+            ):
+                key = item.amazon_sku if found is by_sku else item.amazon_asin
+                found.setdefault(key, {
+                    "id": item.id,
+                    "title": item.title,
+                    "url": item.url,
+                    "auction_id": item.auction_id,
+                    "amazon_sku": item.amazon_sku,
+                })
+        return by_sku, by_asin
+
+    @staticmethod
+    def _lookup_product_info(
+        order_items: list[dict],
+        by_sku: dict[str, dict],
+        by_asin: dict[str, dict],
+    ) -> dict | None:
+        """Match an order's line items to a MonitoredItem (SKU first, then ASIN)."""
         for oi in order_items:
             sku = oi.get("SellerSKU", "")
             asin = oi.get("ASIN", "")
             item_title = oi.get("Title", "")
             item_price = oi.get("ItemPrice", {}).get("Amount", "")
 
-            if sku:
-                item = db.query(MonitoredItem).filter(MonitoredItem.amazon_sku == sku).first()
-                if item:
-                    return {
-                        "title": item.title,
-                        "sku": sku,
-                        "asin": asin,
-                        "yahoo_url": item.url,
-                        "amazon_title": item_title,
-                        "item_price": item_price,
-                        "item_id": item.id,
-                        "auction_id": item.auction_id,
-                    }
+            item = by_sku.get(sku) if sku else None
+            if item:
+                return {
+                    "title": item["title"],
+                    "sku": sku,
+                    "asin": asin,
+                    "yahoo_url": item["url"],
+                    "amazon_title": item_title,
+                    "item_price": item_price,
+                    "item_id": item["id"],
+                    "auction_id": item["auction_id"],
+                }
 
             # Fallback: match by ASIN
-            if asin:
-                item = db.query(MonitoredItem).filter(MonitoredItem.amazon_asin == asin).first()
-                if item:
-                    return {
-                        "title": item.title,
-                        "sku": item.amazon_sku or sku,
-                        "asin": asin,
-                        "yahoo_url": item.url,
-                        "amazon_title": item_title,
-                        "item_price": item_price,
-                        "item_id": item.id,
-                        "auction_id": item.auction_id,
-                    }
+            item = by_asin.get(asin) if asin else None
+            if item:
+                return {
+                    "title": item["title"],
+                    "sku": item["amazon_sku"] or sku,
+                    "asin": asin,
+                    "yahoo_url": item["url"],
+                    "amazon_title": item_title,
+                    "item_price": item_price,
+                    "item_id": item["id"],
+                    "auction_id": item["auction_id"],
+                }
 
         return None
@@ -323,21 +323,17 @@ async def update_listing(
             amazon_fee_pct=item.amazon_fee_pct,
         )
 
-    if new_price > 0 and new_price != item.amazon_price:
+    # Price and lead time go out as one PATCH (only changed fields)
+    price_changed = new_price > 0 and new_price != item.amazon_price
+    if price_changed or body.lead_time_days is not None:
         try:
-            await client.patch_listing_price(settings.sp_api_seller_id, item.amazon_sku, new_price)
-        except AmazonApiError as e:
-            logger.error("Failed to update Amazon price for %s: %s", auction_id, e)
-            raise HTTPException(502, f"SP-API error: {e}") from e
-
-    # Sync lead time to Amazon if changed
-    if body.lead_time_days is not None:
-        try:
-            await client.patch_listing_lead_time(
-                settings.sp_api_seller_id, item.amazon_sku, body.lead_time_days
+            await client.patch_listing_all(
+                settings.sp_api_seller_id, item.amazon_sku,
+                price_jpy=new_price if price_changed else None,
+                lead_time=body.lead_time_days,
             )
         except AmazonApiError as e:
-            logger.error("Failed to update lead time for %s: %s", auction_id, e)
+            logger.error("Failed to update Amazon listing for %s: %s", auction_id, e)
             raise HTTPException(502, f"SP-API error: {e}") from e
 
     item.amazon_price = new_price
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from datetime import datetime, timezone
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
@@ -225,8 +225,8 @@ def update_checklist(auction_id: str, body: dict, db: Session = Depends(get_db))
 
     # Load existing checklist
     try:
-        checklist = json.loads(item.seller_central_checklist) if item.seller_central_checklist else {}
-    except (json.JSONDecodeError, TypeError):
+        checklist = orjson.loads(item.seller_central_checklist) if item.seller_central_checklist else {}
+    except (orjson.JSONDecodeError, TypeError):
         checklist = {}
 
     # Update only valid keys
@@ -234,7 +234,7 @@ def update_checklist(auction_id: str, body: dict, db: Session = Depends(get_db))
         if key in body:
             checklist[key] = bool(body[key])
 
-    item.seller_central_checklist = json.dumps(checklist)
+    item.seller_central_checklist = orjson.dumps(checklist).decode()
     item.updated_at = datetime.now(timezone.utc)
     db.commit()
     return {"ok": True, "checklist": checklist}
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 
 from fastapi import APIRouter, Depends
+from sqlalchemy import case, func
 from sqlalchemy.orm import Session
 
 from ..database import get_db
@@ -24,8 +25,10 @@ def health_check(db: Session = Depends(get_db)):
 
     # Database
     try:
-        total = db.query(MonitoredItem).count()
-        active = db.query(MonitoredItem).filter(MonitoredItem.status == "active").count()
+        total, active = db.query(
+            func.count(MonitoredItem.id),
+            func.count(case((MonitoredItem.status == "active", 1))),
+        ).one()
         services.append(ServiceStatus(name="database", status="ok"))
     except Exception as e:
         logger.warning("Health check: DB error: %s", e)
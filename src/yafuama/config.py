@@ -36,6 +36,8 @@ class Settings(BaseSettings):
     sp_api_marketplace: str = "A1VC38T7YXB528"  # Japan
     sp_api_default_margin_pct: float = 15.0
     sp_api_default_shipping_cost: int = 800
+    sp_api_pool_size: int = 32  # SP-API同期呼び出し用スレッド数
+    listing_sync_fresh_seconds: int = 600  # この秒数以内に同期済みの出品は出品チェックをスキップ
 
     # Amazon配送テンプレート内部ID（SP-API用UUID、全パターン共通）
     shipping_template_id: str = "62ae5dc7-42e5-4178-bfae-9a16971deb85"  # 通常配送1~2
@@ -93,6 +95,7 @@ class Settings(BaseSettings):
     # S3 Image Proxy (Yahoo画像→S3→Amazon)
     s3_image_bucket: str = ""  # S3バケット名（空ならS3アップロード無効）
     s3_image_region: str = "ap-northeast-1"  # 東京リージョン
+    image_proxy_concurrency: int = 8  # プロセス全体での同時ダウンロード/アップロード数（全出品で共有）
 
     @property
     def s3_image_enabled(self) -> bool:
@@ -17,6 +17,7 @@ Value -1 = no data available.
 from __future__ import annotations
 
 import math
+from bisect import bisect_left
 from dataclasses import dataclass
 from typing import Any
 
@@ -329,6 +330,7 @@ _SHIPPING_SIZE_TABLE = [
     (1800, 3060),
     (2000, 3810),
 ]
+_SHIPPING_SIZE_EDGES = [max_mm for max_mm, _ in _SHIPPING_SIZE_TABLE]
 SYSTEM_FEE = 100  # 無在庫1配送毎のシステム利用料
 
 
@@ -348,17 +350,17 @@ def calculate_forwarding_cost(keepa_product: dict) -> int | None:
 
     total_mm = h + l + w
 
-    for max_mm, cost in _SHIPPING_SIZE_TABLE:
-        if total_mm <= max_mm:
-            return cost
-
-    return None  # 200サイズ超 → 対応不可
+    # 3辺合計以上の最小サイズ区分を二分探索
+    idx = bisect_left(_SHIPPING_SIZE_EDGES, total_mm)
+    if idx == len(_SHIPPING_SIZE_TABLE):
+        return None  # 200サイズ超 → 対応不可
+    return _SHIPPING_SIZE_TABLE[idx][1]
 
 
 # --- Deal scoring ---
 
 
-@dataclass
+@dataclass(slots=True)
 class DealCandidate:
     """A potential arbitrage deal: Yahoo item matched with Amazon product."""
     yahoo_title: str
@@ -9,6 +9,7 @@ from time import monotonic
 from typing import Any
 
 import httpx
+import orjson
 
 from ..config import settings
 from . import KeepaApiError
@@ -126,7 +127,7 @@ class KeepaClient:
         if resp.status_code != 200:
             self._handle_error_response(resp)
 
-        data = resp.json()
+        data = orjson.loads(resp.content)
         self._update_tokens(data)
         consumed = data.get("tokensConsumed", "?")
         logger.info(
@@ -191,7 +192,7 @@ class KeepaClient:
         if resp.status_code != 200:
             self._handle_error_response(resp)
 
-        data = resp.json()
+        data = orjson.loads(resp.content)
         self._update_tokens(data)
         consumed = data.get("tokensConsumed", "?")
         logger.info(
@@ -276,7 +277,7 @@ class KeepaClient:
         """Parse error responses (especially 429) and update internal state."""
         if resp.status_code == 429:
             try:
-                data = resp.json()
+                data = orjson.loads(resp.content)
                 self._update_tokens(data)
                 refill_in = data.get("refillIn", 60000)  # ms
                 self._throttled_until = monotonic() + refill_in / 1000.0
@@ -320,7 +321,7 @@ class KeepaClient:
         if resp.status_code != 200:
             self._handle_error_response(resp)
 
-        data = resp.json()
+        data = orjson.loads(resp.content)
         self._update_tokens(data)
         consumed = data.get("tokensConsumed", "?")
         n_products = len(data.get("products") or [])
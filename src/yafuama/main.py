@@ -9,13 +9,14 @@ from logging.handlers import RotatingFileHandler
 from fastapi import FastAPI, Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from .amazon.image_proxy import close_image_proxy_client
 from .api.router import api_router
 from .web.views import router as web_router
 from .config import settings
 from .database import run_migrations
 from .monitor.scheduler import MonitorScheduler
 from .notifier.log_notifier import LogNotifier
-from .notifier.webhook import WebhookNotifier
+from .notifier.webhook import WebhookNotifier, close_webhook_client
 from .scraper.yahoo import YahooAuctionScraper
 
 _log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
@@ -133,6 +134,10 @@ async def lifespan(app: FastAPI):
     await scraper.close()
     if "keepa" in app_state:
         await app_state["keepa"].close()
+    if "sp_api" in app_state:
+        await app_state["sp_api"].close()
+    await close_webhook_client()
+    await close_image_proxy_client()
     app_state.clear()
 
     # SQLite WAL cleanup (shrink .db-wal file)
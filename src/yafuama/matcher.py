@@ -28,8 +28,11 @@ Threshold: score >= 0.40 → likely the same product
 from __future__ import annotations
 
 import re
+import sys
 import unicodedata
+from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 
 # ---------------------------------------------------------------------------
 # Katakana → Hiragana
@@ -171,6 +174,10 @@ _BRAND_ALIASES: dict[str, str] = {
 # Canonical brand names (exported for use in short-model-guard noise filtering)
 CANONICAL_BRAND_NAMES: frozenset[str] = frozenset(_BRAND_ALIASES.values())
 
+# Brand aliases usable as a token prefix (1-char aliases never split a token)
+_SPLIT_BRAND_ALIASES: frozenset[str] = frozenset(a for a in _BRAND_ALIASES if len(a) >= 2)
+_MAX_BRAND_ALIAS_LEN = max(map(len, _SPLIT_BRAND_ALIASES))
+
 
 # ---------------------------------------------------------------------------
 # Product synonyms (Japanese kana → canonical)
@@ -281,7 +288,9 @@ _APPAREL_BRANDS = frozenset({
     "stussy", "すてゅーしー", "ステューシー",
 })
 
-_APPAREL_WORDS = frozenset({
+# Compared against normalized (hiragana) tokens, so katakana spellings are
+# folded to hiragana here — otherwise they could never match.
+_APPAREL_WORDS = frozenset(_kata_to_hira(w) for w in {
     # Clothing
     "服", "衣類", "洋服", "ふく",
     "じゃけっと", "ジャケット", "jacket",
@@ -348,25 +357,26 @@ _APPAREL_WORDS = frozenset({
 })
 
 
+# One alternation pass finds any apparel brand substring (vs. a `in` scan per brand)
+_APPAREL_BRAND_RE = re.compile("|".join(map(re.escape, sorted(_APPAREL_BRANDS))))
+
+
+@lru_cache(maxsize=4096)
 def is_apparel(text: str) -> bool:
     """Check if text is apparel-related (brand or product type).
 
     Works on raw (un-normalized) text so it can be used early in the pipeline.
+    Cached: the same Yahoo title is checked against every product it is
+    matched with.
     """
-    lower = text.lower()
     normalized = normalize(text)
-    tokens = set(tokenize(normalized))
 
     # Check apparel brands (raw text match)
-    for brand in _APPAREL_BRANDS:
-        if brand in lower or brand in normalized:
-            return True
-
-    # Check apparel product words (token match)
-    if tokens & _APPAREL_WORDS:
+    if _APPAREL_BRAND_RE.search(text.lower()) or _APPAREL_BRAND_RE.search(normalized):
         return True
 
-    return False
+    # Check apparel product words (token match)
+    return not _APPAREL_WORDS.isdisjoint(tokenize(normalized))
 
 
 # ---------------------------------------------------------------------------
@@ -383,11 +393,7 @@ def extract_product_info(title: str) -> tuple[str | None, set[str], list[str]]:
         - model_numbers: set of model number strings (e.g. {"sv18", "v12"})
         - key_tokens: meaningful tokens excluding noise, models, and brand
     """
-    norm = normalize(title)
-    tokens = tokenize(norm)
-    tokens = _split_known_brands(tokens)
-    canon = _canonicalize_tokens(tokens)
-    canon = _merge_product_number_tokens(canon)
+    canon = _merge_product_number_tokens(_canonical_title_tokens(title))
     brand = _extract_brand(canon)
     models = _extract_model_numbers(canon)
     key_tokens = [
@@ -400,21 +406,26 @@ def extract_product_info(title: str) -> tuple[str | None, set[str], list[str]]:
 
 def extract_model_numbers_from_text(text: str) -> set[str]:
     """Extract model numbers from arbitrary text (descriptions, features, etc.)."""
-    norm = normalize(text)
-    tokens = tokenize(norm)
-    tokens = _split_known_brands(tokens)
-    canon = _canonicalize_tokens(tokens)
-    canon = _merge_product_number_tokens(canon)
+    canon = _merge_product_number_tokens(_canonical_title_tokens(text))
     return _extract_model_numbers(canon)
 
 
 def tokenize_title(text: str) -> set[str]:
     """Tokenize a title into canonicalized tokens (for title similarity checks)."""
-    norm = normalize(text)
-    tokens = tokenize(norm)
-    tokens = _split_known_brands(tokens)
-    canon = _canonicalize_tokens(tokens)
-    return set(canon)
+    return set(_canonical_title_tokens(text))
+
+
+@lru_cache(maxsize=4096)
+def _canonical_title_tokens(text: str) -> tuple[str, ...]:
+    """normalize → tokenize → brand split → canonicalize, computed once per text.
+
+    The deal scanner runs the same Yahoo/Amazon title through several
+    extractors (accessory check, model numbers, short-model guard); they all
+    share this cached result instead of re-tokenizing.  Tokens are interned so
+    the same word held by many cached titles is stored once.
+    """
+    tokens = _split_known_brands(tokenize(normalize(text)))
+    return tuple(map(sys.intern, _canonicalize_tokens(tokens)))
 
 
 # ---------------------------------------------------------------------------
@@ -423,6 +434,13 @@ def tokenize_title(text: str) -> set[str]:
 
 _JAPANESE_RE = re.compile(r"[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFF]")
 
+# Precompiled helpers for is_valid_model / _model_number_form (hot per-token paths)
+_MODEL_SEPARATOR_RE = re.compile(r"[-\u30fc\s]")
+_TOKEN_MODEL_SEPARATOR_RE = re.compile(r"[-\u30fc]")
+_ASCII_LETTER_RE = re.compile(r"[a-zA-Z]")
+_LOWER_LETTER_RE = re.compile(r"[a-z]")
+_DIGIT_RE = re.compile(r"[0-9]")
+
 # Pattern: pure "word + trailing digits (+ optional 1 letter)" e.g. switch2, bluetooth6a
 _WORD_VERSION_RE = re.compile(r"^([a-zA-Z]+?)(\d+[a-zA-Z]?)$")
 
@@ -464,6 +482,7 @@ _MODEL_BLOCKLIST = frozenset({
 })
 
 
+@lru_cache(maxsize=8192)
 def is_valid_model(s: str) -> bool:
     """Check if a string looks like a real model number.
 
@@ -474,9 +493,9 @@ def is_valid_model(s: str) -> bool:
     - NOT be a spec/unit value (e.g. 32bit, 192khz, 128gb)
     - NOT be in the blocklist (e.g. brand names like 52toys)
     """
-    stripped = re.sub(r"[-\u30fc\s]", "", s)
-    has_letter = bool(re.search(r"[a-zA-Z]", stripped))
-    has_digit = bool(re.search(r"[0-9]", stripped))
+    stripped = _MODEL_SEPARATOR_RE.sub("", s)
+    has_letter = bool(_ASCII_LETTER_RE.search(stripped))
+    has_digit = bool(_DIGIT_RE.search(stripped))
     has_japanese = bool(_JAPANESE_RE.search(stripped))
     if not (has_letter and has_digit and not has_japanese):
         return False
@@ -485,16 +504,18 @@ def is_valid_model(s: str) -> bool:
     if len(stripped) < 5:
         return False
 
+    lowered = stripped.lower()
+
     # Reject spec/unit values (32bit, 192khz, 128gb, etc.)
-    if _SPEC_UNIT_RE.match(stripped.lower()):
+    if _SPEC_UNIT_RE.match(lowered):
         return False
 
     # Reject dimension patterns (30x30cm, 100×200mm)
-    if _DIMENSION_RE.match(stripped.lower()):
+    if _DIMENSION_RE.match(lowered):
         return False
 
     # Reject known non-model strings (brand names etc.)
-    if stripped.lower() in _MODEL_BLOCKLIST:
+    if lowered in _MODEL_BLOCKLIST:
         return False
 
     # Reject "common_word + version_number" pattern
@@ -507,10 +528,7 @@ def is_valid_model(s: str) -> bool:
 
 def extract_accessory_signals_from_text(text: str) -> bool:
     """Check if arbitrary text contains accessory/parts language."""
-    norm = normalize(text)
-    tokens = tokenize(norm)
-    tokens = _split_known_brands(tokens)
-    canon = _canonicalize_tokens(tokens)
+    canon = _canonical_title_tokens(text)
     if _has_accessory_words(canon):
         return True
     # 「用」suffix detection (e.g. "SR750用" = accessory for SR750)
@@ -519,20 +537,23 @@ def extract_accessory_signals_from_text(text: str) -> bool:
     return False
 
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_TOKEN_SPLIT_RE = re.compile(r"[\s/\[\]\(\)（）【】「」『』、。,\.]+")
+
+
 def normalize(text: str) -> str:
     """Normalize text: NFKC → lowercase → katakana→hiragana → boundary spaces."""
     text = unicodedata.normalize("NFKC", text)
     text = text.lower()
     text = _kata_to_hira(text)
     text = _insert_boundary_spaces(text)
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WHITESPACE_RE.sub(" ", text).strip()
     return text
 
 
 def tokenize(text: str) -> list[str]:
     """Split normalized text into tokens on whitespace and delimiters."""
-    raw = re.split(r"[\s/\[\]\(\)（）【】「」『』、。,\.]+", text)
-    return [t for t in raw if t]
+    return [t for t in _TOKEN_SPLIT_RE.split(text) if t]
 
 
 def _split_known_brands(tokens: list[str]) -> list[str]:
@@ -541,26 +562,25 @@ def _split_known_brands(tokens: list[str]) -> list[str]:
     Example: "にんてんどーすいっち" → ["にんてんどー", "すいっち"]
     Short aliases (len < 3, e.g. "ps") only split if remainder is numeric.
     """
-    # Sort longest-first so we match the most specific alias
-    sorted_aliases = sorted(_BRAND_ALIASES.keys(), key=len, reverse=True)
-
+    # Probe the token's own prefixes longest-first against the alias set, so
+    # the most specific alias wins without scanning every alias per token.
     result = []
     for token in tokens:
         found = False
-        for alias in sorted_aliases:
-            if len(alias) < 2:
+        for n in range(min(len(token), _MAX_BRAND_ALIAS_LEN), 1, -1):
+            alias = token[:n]
+            if alias not in _SPLIT_BRAND_ALIASES:
                 continue
-            if token == alias:
+            if n == len(token):
                 break  # Exact match — no split needed
-            if token.startswith(alias) and len(token) > len(alias):
-                remainder = token[len(alias):]
-                # Short aliases: only split if remainder is purely numeric
-                if len(alias) < 3 and not remainder.isdigit():
-                    continue
-                result.append(alias)
-                result.append(remainder)
-                found = True
-                break
+            remainder = token[n:]
+            # Short aliases: only split if remainder is purely numeric
+            if n < 3 and not remainder.isdigit():
+                continue
+            result.append(alias)
+            result.append(remainder)
+            found = True
+            break
         if not found:
             result.append(token)
     return result
@@ -597,7 +617,7 @@ _DIMENSION_RE = re.compile(
 _MERGE_PREFIX_WORDS = frozenset({"hero"})
 
 
-def _merge_product_number_tokens(tokens: list[str]) -> list[str]:
+def _merge_product_number_tokens(tokens: Sequence[str]) -> list[str]:
     """Merge product line names with adjacent number tokens.
 
     Two strategies:
@@ -605,7 +625,6 @@ def _merge_product_number_tokens(tokens: list[str]) -> list[str]:
     2. General: short letter-only token (2-4 chars, not a common word/brand)
        + digit token → merge (e.g. "ie" + "200" → "ie200")
     """
-    brand_names = set(_BRAND_ALIASES.values())
     result: list[str] = []
     i = 0
     while i < len(tokens):
@@ -619,7 +638,7 @@ def _merge_product_number_tokens(tokens: list[str]) -> list[str]:
             # General: short letter-only prefix (2-4 chars)
             # that isn't a common word or brand → likely a model prefix
             if (t.isalpha() and 2 <= len(t) <= 4
-                    and t not in COMMON_WORDS and t not in brand_names):
+                    and t not in COMMON_WORDS and t not in CANONICAL_BRAND_NAMES):
                 result.append(t + tokens[i + 1])
                 i += 2
                 continue
@@ -636,25 +655,34 @@ def _extract_model_numbers(tokens: list[str]) -> set[str]:
     """
     models = set()
     for t in tokens:
-        # Strip hyphens and long-vowel marks for the check
-        stripped = re.sub(r"[-ー]", "", t)
-        has_letter = bool(re.search(r"[a-z]", stripped))
-        has_digit = bool(re.search(r"[0-9]", stripped))
-        if has_letter and has_digit and len(stripped) >= 5:
-            if _SPEC_UNIT_RE.match(stripped):
-                continue  # Skip spec/unit tokens (4k, 1ch, 128gb, etc.)
-            if _DIMENSION_RE.match(t):
-                continue  # Skip dimension tokens (30x30cm, 100×200mm)
-            models.add(stripped)
+        model = _model_number_form(t)
+        if model:
+            models.add(model)
     return models
 
 
+@lru_cache(maxsize=8192)
+def _model_number_form(t: str) -> str | None:
+    """Return the hyphen-stripped model number for a token, or None.
+
+    Cached per token: the same tokens recur across titles in every scan cycle.
+    """
+    # Strip hyphens and long-vowel marks for the check
+    stripped = _TOKEN_MODEL_SEPARATOR_RE.sub("", t)
+    has_letter = bool(_LOWER_LETTER_RE.search(stripped))
+    has_digit = bool(_DIGIT_RE.search(stripped))
+    if not (has_letter and has_digit and len(stripped) >= 5):
+        return None
+    if _SPEC_UNIT_RE.match(stripped):
+        return None  # Skip spec/unit tokens (4k, 1ch, 128gb, etc.)
+    if _DIMENSION_RE.match(t):
+        return None  # Skip dimension tokens (30x30cm, 100×200mm)
+    return stripped
+
+
 def _extract_brand(tokens: list[str]) -> str | None:
     """Find the first known brand among canonicalized tokens."""
-    for t in tokens:
-        if t in _BRAND_ALIASES.values():
-            return t
-    return None
+    return next((t for t in tokens if t in CANONICAL_BRAND_NAMES), None)
 
 
 # Regex to extract the letter prefix of a model number (e.g. "sv" from "sv10k")
@@ -726,14 +754,30 @@ for _gi, _group in enumerate(_PRODUCT_TYPE_GROUPS):
         _TYPE_TOKEN_TO_GROUP[_tok] = _gi
 
 
-def _extract_product_types(tokens: list[str]) -> set[int]:
-    """Return the set of product-type group indices found in the token list."""
+def _scan_title_tokens(tokens: list[str]) -> tuple[str | None, set[int], bool, set[str]]:
+    """One pass over canonical tokens for the per-title signals match_products needs.
+
+    Returns (brand, product_type_groups, has_you, clean_tokens):
+    - brand: first known canonical brand (same as _extract_brand)
+    - product_type_groups: product-type group indices present
+    - has_you: a token starts or ends with 「用」 (accessory "for X")
+    - clean_tokens: tokens without noise words / 1-char tokens (for Jaccard)
+    """
+    brand: str | None = None
     groups: set[int] = set()
+    has_you = False
+    clean: set[str] = set()
     for t in tokens:
+        if brand is None and t in CANONICAL_BRAND_NAMES:
+            brand = t
         gi = _TYPE_TOKEN_TO_GROUP.get(t)
         if gi is not None:
             groups.add(gi)
-    return groups
+        if not has_you and (t.startswith("用") or t.endswith("用")):
+            has_you = True
+        if len(t) >= 2 and t not in _NOISE_WORDS:
+            clean.add(t)
+    return brand, groups, has_you, clean
 
 
 # ---------------------------------------------------------------------------
@@ -793,6 +837,10 @@ _SUBMODEL_CANONICAL: dict[str, str] = {
 }
 
 
+# Only these are probed as substrings of long concatenated tokens
+_LONG_SUBMODEL_WORDS = tuple(sw for sw in _SUBMODEL_WORDS if len(sw) >= 4)
+
+
 def _extract_submodel_hits(tokens: list[str]) -> set[str]:
     """Extract submodel words from tokens, with substring matching for
     concatenated katakana (e.g. "くりえいたーえでぃしょん" contains "くりえいたー").
@@ -805,8 +853,8 @@ def _extract_submodel_hits(tokens: list[str]) -> set[str]:
         if t in _SUBMODEL_WORDS:
             found.add(_SUBMODEL_CANONICAL.get(t, t))
         elif len(t) >= 6:
-            for sw in _SUBMODEL_WORDS:
-                if len(sw) >= 4 and sw in t:
+            for sw in _LONG_SUBMODEL_WORDS:
+                if sw in t:
                     found.add(_SUBMODEL_CANONICAL.get(sw, sw))
     # Check adjacent token pairs for compound submodel words
     for i in range(len(tokens) - 1):
@@ -822,14 +870,14 @@ def _submodel_conflict(y_tokens: list[str], a_tokens: list[str]) -> bool:
     Only triggers when at least one side has model numbers (to avoid
     false positives on generic titles).
     """
-    y_sub = _extract_submodel_hits(y_tokens)
-    a_sub = _extract_submodel_hits(a_tokens)
     # Only flag conflict when BOTH sides have submodel words but different.
     # One side omitting the variant name (y_sub empty) is not a conflict
     # — the listing simply doesn't mention the variant.
-    if not y_sub or not a_sub:
+    y_sub = _extract_submodel_hits(y_tokens)
+    if not y_sub:
         return False
-    return y_sub != a_sub
+    a_sub = _extract_submodel_hits(a_tokens)
+    return bool(a_sub) and y_sub != a_sub
 
 
 # ---------------------------------------------------------------------------
@@ -838,7 +886,8 @@ def _submodel_conflict(y_tokens: list[str], a_tokens: list[str]) -> bool:
 # (e.g. "WH-1000XM5 イヤーパッド" vs "WH-1000XM5 ヘッドホン").
 # ---------------------------------------------------------------------------
 
-_ACCESSORY_WORDS = frozenset({
+# Folded to hiragana like _APPAREL_WORDS (e.g. "防水ケース" → "防水けーす").
+_ACCESSORY_WORDS = frozenset(_kata_to_hira(w) for w in {
     # Pads / cushions
     "ぱっど", "pad", "いやーぱっど", "くっしょん", "cushion",
     # Adapters / mounts
@@ -929,22 +978,24 @@ _ACCESSORY_PREFIX_SUFFIXES = frozenset({
     "けーす", "case",
 })
 
+# Short words (2 chars) checked separately for suffix and prefix in
+# _has_accessory_words; longer accessory words get suffix/prefix matching.
+_SHORT_SUFFIX_WORDS = frozenset({"のみ", "互換", "ごかん", "対応", "たいおう", "ひだり", "みぎ", "左", "右"})
+_SHORT_PREFIX_WORDS = frozenset({"右耳", "左耳", "みぎみみ", "ひだりみみ", "互換", "ごかん", "収納", "しゅうのう", "充電", "じゅうでん"})
+_LONG_ACCESSORY_WORDS: tuple[str, ...] = tuple(w for w in _ACCESSORY_WORDS if len(w) >= 3)
 
-def _has_accessory_words(tokens: list[str]) -> bool:
+
+def _has_accessory_words(tokens: Sequence[str]) -> bool:
     """Check if token list contains words indicating a part/accessory.
 
     Uses exact match, suffix match, AND guarded prefix match to catch:
     - "電源あだぷたー" → ends with "あだぷたー" (accessory word)
     - "へっど軽量版"   → starts with "へっど" + remainder has confirming suffix
     """
-    token_set = set(tokens)
-    # Fast path: exact match
-    if token_set & _ACCESSORY_WORDS:
+    # Fast path: exact match (isdisjoint probes the frozenset without copying tokens)
+    if not _ACCESSORY_WORDS.isdisjoint(tokens):
         return True
     # Suffix + guarded prefix match for compounds
-    # Short words (2 chars) checked separately for suffix and prefix
-    _SHORT_SUFFIX_WORDS = frozenset({"のみ", "互換", "ごかん", "対応", "たいおう", "ひだり", "みぎ", "左", "右"})
-    _SHORT_PREFIX_WORDS = frozenset({"右耳", "左耳", "みぎみみ", "ひだりみみ", "互換", "ごかん", "収納", "しゅうのう", "充電", "じゅうでん"})
     for t in tokens:
         if len(t) < 4:
             continue
@@ -963,8 +1014,8 @@ def _has_accessory_words(tokens: list[str]) -> bool:
         for pw in _SHORT_PREFIX_WORDS:
             if t.startswith(pw) and len(t) > len(pw):
                 return True
-        for aw in _ACCESSORY_WORDS:
-            if len(aw) >= 3 and t != aw:
+        for aw in _LONG_ACCESSORY_WORDS:
+            if t != aw:
                 # Suffix match (safe — "電源あだぷたー")
                 if t.endswith(aw):
                     return True
@@ -997,7 +1048,7 @@ def _accessory_in_leading_tokens(tokens: list[str], max_pos: int = 5) -> bool:
 
 def _has_main_product_words(tokens: list[str]) -> bool:
     """Check if token list contains words indicating a complete/main product."""
-    return bool(set(tokens) & _MAIN_PRODUCT_WORDS)
+    return not _MAIN_PRODUCT_WORDS.isdisjoint(tokens)
 
 
 # ---------------------------------------------------------------------------
@@ -1049,7 +1100,7 @@ MATCH_THRESHOLD = 0.40
 STRICT_MATCH_THRESHOLD = 0.55  # For high-margin deals (50%+)
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     """Result of comparing two product titles."""
 
@@ -1146,9 +1197,11 @@ def match_products(yahoo_title: str, amazon_title: str) -> MatchResult:
             model_conflict = True
             score -= 0.30
 
+    # Brand, product types, 「用」 and clean tokens in one pass per title
+    y_brand, y_types, y_has_you, y_clean = _scan_title_tokens(y_canon)
+    a_brand, a_types, a_has_you, a_clean = _scan_title_tokens(a_canon)
+
     # --- Brand comparison ---
-    y_brand = _extract_brand(y_canon)
-    a_brand = _extract_brand(a_canon)
     brand_match = False
     brand_conflict = False
 
@@ -1161,8 +1214,6 @@ def match_products(yahoo_title: str, amazon_title: str) -> MatchResult:
             score -= 0.10
 
     # --- Product type conflict (パック vs BOX, ケース vs 本体, etc.) ---
-    y_types = _extract_product_types(y_canon)
-    a_types = _extract_product_types(a_canon)
     type_conflict = False
 
     if y_types and a_types and not (y_types & a_types):
@@ -1178,8 +1229,7 @@ def match_products(yahoo_title: str, amazon_title: str) -> MatchResult:
 
     # --- "用" (for/compatible with) detection ---
     # "V11用ローラーヘッド" → "V11" + "用..." = accessory "for V11"
-    y_has_you = any(t.startswith("用") or t.endswith("用") for t in y_canon)
-    a_has_you = any(t.startswith("用") or t.endswith("用") for t in a_canon)
+    # (y_has_you / a_has_you collected by _scan_title_tokens above)
 
     # --- Accessory vs main product conflict ---
     y_is_accessory = _has_accessory_words(y_canon) or y_multi_model or y_has_you
@@ -1211,8 +1261,6 @@ def match_products(yahoo_title: str, amazon_title: str) -> MatchResult:
         score -= 0.40  # Very strong penalty — different quantity = different deal
 
     # --- Token Jaccard similarity (excluding noise) ---
-    y_clean = {t for t in y_canon if t not in _NOISE_WORDS and len(t) >= 2}
-    a_clean = {t for t in a_canon if t not in _NOISE_WORDS and len(t) >= 2}
     jaccard = 0.0
 
     if y_clean and a_clean:
@@ -1261,9 +1309,8 @@ def keywords_are_similar(kw1: str, kw2: str, threshold: float = 0.6) -> bool:
         return False
 
     # Layer 0: Brand/model guard → different search intent
-    brand_values = set(_BRAND_ALIASES.values())
-    b1 = t1 & brand_values
-    b2 = t2 & brand_values
+    b1 = t1 & CANONICAL_BRAND_NAMES
+    b2 = t2 & CANONICAL_BRAND_NAMES
     # Different brands → never similar ("sony X" vs "dyson X")
     if b1 and b2 and b1 != b2:
         return False
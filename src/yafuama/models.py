@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, Text, UniqueConstraint
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .database import Base
@@ -106,6 +106,8 @@ class DealAlert(Base):
     __tablename__ = "deal_alerts"
     __table_args__ = (
         UniqueConstraint("yahoo_auction_id", "amazon_asin", name="uq_deal_alert"),
+        # ASIN dedup in DealScanner._process_deal filters by ASIN + status
+        Index("ix_deal_alerts_asin_status", "amazon_asin", "status"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -5,10 +5,12 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+from itertools import islice
 from time import monotonic
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from ..config import settings
 from ..database import SessionLocal
@@ -30,6 +32,10 @@ logger = logging.getLogger(__name__)
 YAHOO_AUCTION_URL = "https://auctions.yahoo.co.jp/jp/auction/{}"
 
 _BARCODE_RE = re.compile(r"^\d{8,}$")
+_MODEL_SEPARATOR_RE = re.compile(r"[-\u30fc]")
+
+# Dialect-specific INSERT constructs supporting ON CONFLICT DO NOTHING
+_CONFLICT_INSERTS = {"sqlite": sqlite_insert, "postgresql": pg_insert}
 
 # Noise words excluded from short-model-number guard's common-token check.
 # These are too generic to confirm that two products are the same.
@@ -58,6 +64,11 @@ _SHORT_MODEL_GUARD_NOISE = frozenset({
     "こーどれす",  # already in _MAIN_PRODUCT_WORDS but also here for noise
 })
 
+# Everything the short-model guard ignores when looking for a shared title token
+_SHORT_MODEL_GUARD_EXCLUDED = (
+    _SHORT_MODEL_GUARD_NOISE | CANONICAL_BRAND_NAMES | CANONICAL_PRODUCT_TYPES
+)
+
 
 def _is_barcode(text: str) -> bool:
     """Detect barcodes/EAN codes masquerading as model numbers."""
@@ -117,7 +128,7 @@ class DealScanner:
     @staticmethod
     def _normalize_model(model: str) -> str:
         """Normalize model number for comparison: lowercase + remove hyphens."""
-        return re.sub(r"[-\u30fc]", "", model.lower())
+        return _MODEL_SEPARATOR_RE.sub("", model.lower())
 
     @staticmethod
     def _is_book_asin(asin: str) -> bool:
@@ -164,16 +175,14 @@ class DealScanner:
             models = [m for m in title_models
                       if len(m) >= 5 and self._is_valid_model(m)]
 
-        # Deduplicate by normalized form
-        seen: set[str] = set()
-        unique: list[str] = []
+        # Deduplicate by normalized form (first spelling wins), stopping at 3
+        unique: dict[str, str] = {}
         for m in models:
-            norm = self._normalize_model(m)
-            if norm not in seen:
-                seen.add(norm)
-                unique.append(m)
+            unique.setdefault(self._normalize_model(m), m)
+            if len(unique) == 3:
+                break
 
-        return unique[:3]
+        return list(unique.values())
 
     @staticmethod
     def _is_auction_ended(yr) -> bool:
@@ -184,7 +193,21 @@ class DealScanner:
         now = datetime.now(timezone.utc)
         return end_time <= now
 
-    async def _match_yahoo_to_amazon(self, yr, keepa_product: dict):
+    def _extract_amazon_models(self, keepa_product: dict) -> set[str]:
+        """Normalized (5+ char) model numbers of a Keepa product (model field + title)."""
+        amazon_models: set[str] = set()
+        model_field = (keepa_product.get("model") or "").strip()
+        if (model_field and not _is_barcode(model_field)
+                and len(model_field) >= 5 and is_valid_model(model_field)):
+            amazon_models.add(self._normalize_model(model_field))
+        for m in extract_model_numbers_from_text(keepa_product.get("title") or ""):
+            if len(m) >= 5:
+                amazon_models.add(self._normalize_model(m))
+        return amazon_models
+
+    async def _match_yahoo_to_amazon(
+        self, yr, keepa_product: dict, amazon_models: set[str] | None = None,
+    ):
         """Match a Yahoo item to an Amazon/Keepa product using model number matching.
 
         Simple exact-match after hyphen removal:
@@ -193,6 +216,9 @@ class DealScanner:
         - Exact match only (SV18 vs SV18FF = different products)
         - Exclude apparel, junk, accessories
 
+        ``amazon_models`` may be passed in when matching many Yahoo results
+        against the same product, so the Keepa side is extracted only once.
+
         Returns a scored DealCandidate or None.
         """
         yahoo_title = yr.title if hasattr(yr, "title") else yr.get("title", "")
@@ -205,26 +231,15 @@ class DealScanner:
         if self._is_auction_ended(yr):
             return None
 
-        # Exclude apparel and junk
-        if is_apparel(yahoo_title):
-            return None
+        # Cheapest rejections first: a substring test, then the Keepa-side
+        # models (precomputed per product), before any Yahoo title tokenizing.
         if "ジャンク" in yahoo_title:
             return None
 
-        # Accessory check
-        if extract_accessory_signals_from_text(yahoo_title):
-            return None
-
         # Extract Amazon model numbers (normalized, 5+ chars)
-        amazon_models: set[str] = set()
-        model_field = (keepa_product.get("model") or "").strip()
-        if (model_field and not _is_barcode(model_field)
-                and len(model_field) >= 5 and is_valid_model(model_field)):
-            amazon_models.add(self._normalize_model(model_field))
+        if amazon_models is None:
+            amazon_models = self._extract_amazon_models(keepa_product)
         amazon_title = keepa_product.get("title") or ""
-        for m in extract_model_numbers_from_text(amazon_title):
-            if len(m) >= 5:
-                amazon_models.add(self._normalize_model(m))
 
         if not amazon_models:
             return None
@@ -240,26 +255,27 @@ class DealScanner:
         if not matched_models:
             return None
 
+        # Accessory check (reuses the title tokens cached by the model extraction)
+        if extract_accessory_signals_from_text(yahoo_title):
+            return None
+
+        # Exclude apparel
+        if is_apparel(yahoo_title):
+            return None
+
         # Short model number guard: if the matched model is ≤7 chars,
         # require at least 1 common meaningful title token (excluding model
         # numbers and noise words) to confirm the products are the same.
         shortest_match = min(len(m) for m in matched_models)
         if shortest_match <= 7:
-            # Build exclusion set: all model forms (already lowercase)
-            exclude_models = set()
-            for m in matched_models:
-                exclude_models.add(m)              # lowercase normalized
-                exclude_models.add(m.upper())      # uppercase
+            # Title tokens are already normalized to lowercase, so model forms
+            # only need hyphens removed to compare with matched_models.
             yahoo_tokens = {t for t in tokenize_title(yahoo_title)
-                           if t.lower().replace("-", "") not in exclude_models
-                           and t not in _SHORT_MODEL_GUARD_NOISE
-                           and t not in CANONICAL_BRAND_NAMES
-                           and t not in CANONICAL_PRODUCT_TYPES}
+                           if t not in _SHORT_MODEL_GUARD_EXCLUDED
+                           and t.replace("-", "") not in matched_models}
             amazon_tokens = {t for t in tokenize_title(amazon_title)
-                            if t.lower().replace("-", "") not in exclude_models
-                            and t not in _SHORT_MODEL_GUARD_NOISE
-                            and t not in CANONICAL_BRAND_NAMES
-                            and t not in CANONICAL_PRODUCT_TYPES}
+                            if t not in _SHORT_MODEL_GUARD_EXCLUDED
+                            and t.replace("-", "") not in matched_models}
             if not yahoo_tokens & amazon_tokens:
                 return None
 
@@ -354,6 +370,9 @@ class DealScanner:
         )
         return False, None
 
+    # バリエーション画像を確認する最大ASIN数
+    _VARIATION_CHECK_LIMIT = 5
+
     async def _search_variation_match(self, deal, yahoo_img_url: str) -> str | None:
         """Search Amazon catalog variations for an image match."""
         from ..vision.image_verifier import sp_api_main_image_url
@@ -366,7 +385,7 @@ class DealScanner:
             return None
 
         # Collect variation ASINs from relationships
-        variation_asins = self._extract_variation_asins(catalog, asin)
+        variation_asins = self._extract_variation_asins(catalog, asin, self._VARIATION_CHECK_LIMIT)
 
         # If this ASIN is a child, get parent's children
         if not variation_asins:
@@ -374,7 +393,9 @@ class DealScanner:
             if parent_asin:
                 try:
                     parent_catalog = await self._sp_api.get_catalog_item_with_variations(parent_asin)
-                    variation_asins = self._extract_variation_asins(parent_catalog, asin)
+                    variation_asins = self._extract_variation_asins(
+                        parent_catalog, asin, self._VARIATION_CHECK_LIMIT,
+                    )
                 except Exception:
                     pass
 
@@ -383,9 +404,9 @@ class DealScanner:
 
         logger.info("Checking %d variations for ASIN %s", len(variation_asins), asin)
 
-        # Fetch images for each variation (limit to 5)
+        # Fetch images for each variation (already capped at _VARIATION_CHECK_LIMIT)
         variation_images: list[tuple[str, str]] = []
-        for var_asin in variation_asins[:5]:
+        for var_asin in variation_asins:
             try:
                 var_catalog = await self._sp_api.get_catalog_item(var_asin)
                 var_img = sp_api_main_image_url(var_catalog)
@@ -402,16 +423,22 @@ class DealScanner:
         )
 
     @staticmethod
-    def _extract_variation_asins(catalog: dict, exclude_asin: str) -> list[str]:
-        """Extract child variation ASINs from SP-API catalog response."""
-        asins: list[str] = []
-        for rel_set in catalog.get("relationships", []):
-            for rel in rel_set.get("relationships", []):
-                for child in rel.get("childAsins", []):
-                    child_asin = child if isinstance(child, str) else child.get("asin", "")
-                    if child_asin and child_asin != exclude_asin:
-                        asins.append(child_asin)
-        return asins
+    def _extract_variation_asins(
+        catalog: dict, exclude_asin: str, limit: int | None = None,
+    ) -> list[str]:
+        """Extract child variation ASINs from SP-API catalog response.
+
+        Stops after ``limit`` ASINs so large parent families are not walked in full.
+        """
+        asins = (
+            child if isinstance(child, str) else child.get("asin", "")
+            for rel_set in catalog.get("relationships", [])
+            for rel in rel_set.get("relationships", [])
+            for child in rel.get("childAsins", [])
+        )
+        return list(islice(
+            (a for a in asins if a and a != exclude_asin), limit,
+        ))
 
     @staticmethod
     def _extract_parent_asin(catalog: dict) -> str | None:
@@ -489,7 +516,9 @@ class DealScanner:
 
         # Filter: exclude products where used >= effective new price
         # Compare against the lower of Amazon's own price and 3rd-party new
-        # Also dedup by ASIN (categories may overlap)
+        # Also drop products with no current used price (score_deal can never
+        # price them, so their Yahoo searches would be wasted) and dedup by
+        # ASIN (categories may overlap)
         seen_asins = set()
         filtered = []
         for p in all_products:
@@ -501,6 +530,8 @@ class DealScanner:
             stats = p.get("stats") or {}
             current = stats.get("current") or []
             used = current[2] if len(current) > 2 and current[2] not in (None, -1) else 0
+            if used <= 0:
+                continue
             amazon_price = current[0] if len(current) > 0 and current[0] not in (None, -1) else 0
             new_3p = current[1] if len(current) > 1 and current[1] not in (None, -1) else 0
             valid_new = [x for x in (amazon_price, new_3p) if x > 0]
@@ -540,6 +571,7 @@ class DealScanner:
                     (product.get("title") or "")[:80],
                 )
                 continue
+            amazon_models = self._extract_amazon_models(product)
 
             for keyword in keywords:
                 if yahoo_searches >= settings.pf_max_yahoo_searches:
@@ -579,7 +611,7 @@ class DealScanner:
                 # Match each Yahoo result against this Amazon product
                 deals = []
                 for yr in yahoo_results:
-                    deal = await self._match_yahoo_to_amazon(yr, product)
+                    deal = await self._match_yahoo_to_amazon(yr, product, amazon_models)
                     if deal:
                         stats["match_passed"] += 1
                         if not (
@@ -660,7 +692,7 @@ class DealScanner:
 
         # Check if already notified (exact auction+ASIN match)
         existing = (
-            db.query(DealAlert)
+            db.query(DealAlert.id)
             .filter(
                 DealAlert.yahoo_auction_id == deal.yahoo_auction_id,
                 DealAlert.amazon_asin == deal.amazon_asin,
@@ -674,7 +706,7 @@ class DealScanner:
         # ASIN dedup: skip if same ASIN notified recently (different auction)
         dedup_cutoff = datetime.now(timezone.utc) - timedelta(hours=settings.deal_dedup_hours)
         recent_same_asin = (
-            db.query(DealAlert)
+            db.query(DealAlert.gross_profit)
             .filter(
                 DealAlert.amazon_asin == deal.amazon_asin,
                 DealAlert.status.in_(["active", "listed"]),
@@ -705,8 +737,11 @@ class DealScanner:
         except Exception:
             pass  # Network error — don't block the deal
 
-        # Record alert BEFORE webhook (crash-safe: prevents duplicate notifications)
-        alert = DealAlert(
+        # Record alert BEFORE webhook (crash-safe: prevents duplicate notifications).
+        # ON CONFLICT DO NOTHING on uq_deal_alert skips a concurrent duplicate
+        # in the same statement, without a savepoint round-trip.
+        insert = _CONFLICT_INSERTS[db.get_bind().dialect.name]
+        stmt = insert(DealAlert).values(
             search_keyword=keyword,
             yahoo_auction_id=deal.yahoo_auction_id,
             amazon_asin=deal.amazon_asin,
@@ -721,13 +756,8 @@ class DealScanner:
             gross_margin_pct=deal.gross_margin_pct,
             amazon_fee_pct=round(deal.amazon_fee / deal.sell_price * 100, 1) if deal.sell_price else 10.0,
             forwarding_cost=deal.forwarding_cost,
-        )
-        try:
-            nested = db.begin_nested()
-            db.add(alert)
-            db.flush()
-        except IntegrityError:
-            nested.rollback()
+        ).on_conflict_do_nothing(index_elements=["yahoo_auction_id", "amazon_asin"])
+        if db.execute(stmt).rowcount == 0:
             logger.info("Skip integrity dup: %s + %s", deal.yahoo_auction_id, deal.amazon_asin)
             return None
 
@@ -6,6 +6,7 @@ import logging
 from datetime import datetime, timezone, timedelta
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
 
 from ..config import settings
@@ -19,6 +20,10 @@ from ..scraper.yahoo import YahooAuctionScraper
 
 logger = logging.getLogger(__name__)
 
+# Every ended MonitoredItem.status (see AuctionData.status). Matched with IN so
+# the status index is used; SQLite's case-insensitive LIKE cannot use it.
+_ENDED_STATUSES = ("ended_sold", "ended_no_winner")
+
 
 class MonitorScheduler:
     def __init__(
@@ -132,24 +137,43 @@ class MonitorScheduler:
         """
         db: Session = SessionLocal()
         try:
-            items = (
-                db.query(MonitoredItem)
+            # Decide which items are due from the scheduling columns only;
+            # full rows are loaded just for the items actually checked.
+            now = datetime.now(timezone.utc)
+            schedule_rows = (
+                db.query(
+                    MonitoredItem.id,
+                    MonitoredItem.last_checked_at,
+                    MonitoredItem.check_interval_seconds,
+                    MonitoredItem.auto_adjust_interval,
+                    MonitoredItem.end_time,
+                )
                 .filter(
                     MonitoredItem.is_monitoring_active == True,
                     MonitoredItem.status == "active",
                 )
-                .all()
+                .yield_per(500)
             )
-            if items:
-                logger.info("Monitor loop: %d active items to check", len(items))
-
-            now = datetime.now(timezone.utc)
-            for item in items:
-                interval = self._effective_interval(item)
-                if item.last_checked_at:
-                    last = item.last_checked_at if item.last_checked_at.tzinfo else item.last_checked_at.replace(tzinfo=timezone.utc)
+            active_count = 0
+            due_ids: list[int] = []
+            for row in schedule_rows:
+                active_count += 1
+                interval = self._effective_interval(row, now)
+                if row.last_checked_at:
+                    last = row.last_checked_at if row.last_checked_at.tzinfo else row.last_checked_at.replace(tzinfo=timezone.utc)
                     if (now - last).total_seconds() < interval:
                         continue
+                due_ids.append(row.id)
+            if active_count:
+                logger.info("Monitor loop: %d active items to check", active_count)
+
+            items = (
+                db.query(MonitoredItem)
+                .filter(MonitoredItem.id.in_(due_ids))
+                .order_by(MonitoredItem.id)
+                .all()
+            ) if due_ids else []
+            for item in items:
                 try:
                     await self._check_item(item, db)
                     # Per-item commit: ensures Amazon-side changes (delist etc.)
@@ -178,9 +202,10 @@ class MonitorScheduler:
     async def _check_item(self, item: MonitoredItem, db: Session) -> None:
         logger.debug("Checking %s (%s)", item.auction_id, item.title)
         data = await self.scraper.fetch_auction(item.auction_id)
+        now = datetime.now(timezone.utc)
         if not data:
             logger.warning("Failed to fetch %s", item.auction_id)
-            item.last_checked_at = datetime.now(timezone.utc)
+            item.last_checked_at = now
             return
 
         changes: list[StatusHistory] = []
@@ -214,8 +239,8 @@ class MonitorScheduler:
         item.bid_count = data.bid_count
         item.end_time = data.end_time
         item.status = data.status
-        item.last_checked_at = datetime.now(timezone.utc)
-        item.updated_at = datetime.now(timezone.utc)
+        item.last_checked_at = now
+        item.updated_at = now
 
         # Sync DealAlert prices when Yahoo price changes
         # Skip if old_win_price is 0 (initial scrape, not a real change)
@@ -235,7 +260,7 @@ class MonitorScheduler:
         if data.status != "active":
             item.is_monitoring_active = False
             if item.ended_at is None:
-                item.ended_at = datetime.now(timezone.utc)
+                item.ended_at = now
             logger.info("Item %s ended (%s), stopping monitor", item.auction_id, data.status)
             # Expire corresponding DealAlerts (both active and listed)
             expired_count = (
@@ -336,24 +361,27 @@ class MonitorScheduler:
             )
 
     @staticmethod
-    def _effective_interval(item: MonitoredItem) -> float:
-        """Smart interval: shorten as end_time approaches."""
-        if not item.auto_adjust_interval or not item.end_time:
-            return item.check_interval_seconds
+    def _effective_interval(row: Row, now: datetime) -> float:
+        """Smart interval: shorten as end_time approaches.
+
+        ``row`` carries the MonitoredItem scheduling columns selected in
+        _check_all (check_interval_seconds, auto_adjust_interval, end_time).
+        """
+        if not row.auto_adjust_interval or not row.end_time:
+            return row.check_interval_seconds
 
-        now = datetime.now(timezone.utc)
         # Ensure end_time is timezone-aware (SQLite stores naive UTC)
-        end = item.end_time if item.end_time.tzinfo else item.end_time.replace(tzinfo=timezone.utc)
+        end = row.end_time if row.end_time.tzinfo else row.end_time.replace(tzinfo=timezone.utc)
         remaining = (end - now).total_seconds()
 
         if remaining <= 0:
-            return item.check_interval_seconds  # will be stopped after check
+            return row.check_interval_seconds  # will be stopped after check
         if remaining < 1800:  # < 30 min
             return settings.min_check_interval
         if remaining < 7200:  # < 2 hours
-            return item.check_interval_seconds / 2
+            return row.check_interval_seconds / 2
 
-        return item.check_interval_seconds
+        return row.check_interval_seconds
 
     @staticmethod
     def _cleanup_ended_items(db: Session, now: datetime) -> None:
@@ -369,7 +397,7 @@ class MonitorScheduler:
         stale = (
             db.query(MonitoredItem)
             .filter(
-                MonitoredItem.status.like("ended_%"),
+                MonitoredItem.status.in_(_ENDED_STATUSES),
                 MonitoredItem.amazon_listing_status != "active",
                 MonitoredItem.amazon_listing_status != "error",
                 MonitoredItem.updated_at < cutoff,
@@ -1010,7 +1038,7 @@ class MonitorScheduler:
             stuck_items = (
                 db.query(MonitoredItem)
                 .filter(
-                    MonitoredItem.status.like("ended_%"),
+                    MonitoredItem.status.in_(_ENDED_STATUSES),
                     MonitoredItem.amazon_sku.isnot(None),
                 )
                 .limit(5)
@@ -17,6 +17,24 @@ MAX_RETRIES = 3
 RETRY_BACKOFF = (1, 3, 5)  # seconds
 LINE_NOTIFY_URL = "https://notify-api.line.me/api/notify"
 
+# Shared across notifications so webhook hosts reuse pooled keep-alive connections
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(timeout=10)
+    return _client
+
+
+async def close_webhook_client() -> None:
+    """Close the shared webhook client (called on app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 async def send_webhook(
     url: str,
@@ -30,20 +48,20 @@ async def send_webhook(
     For LINE Notify, sends form-encoded data with Bearer token auth.
     For Discord/Slack/generic, sends JSON.
     """
+    client = _get_client()
     for attempt in range(max_retries):
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                if webhook_type == "line":
-                    # LINE Notify: form-encoded with Bearer token in URL or separate
-                    token = payload.get("token", "")
-                    resp = await client.post(
-                        url,
-                        data={"message": payload["message"]},
-                        headers={"Authorization": f"Bearer {token}"} if token else {},
-                    )
-                else:
-                    resp = await client.post(url, json=payload)
-                resp.raise_for_status()
+            if webhook_type == "line":
+                # LINE Notify: form-encoded with Bearer token in URL or separate
+                token = payload.get("token", "")
+                resp = await client.post(
+                    url,
+                    data={"message": payload["message"]},
+                    headers={"Authorization": f"Bearer {token}"} if token else {},
+                )
+            else:
+                resp = await client.post(url, json=payload)
+            resp.raise_for_status()
             return True
         except Exception as e:
             wait = RETRY_BACKOFF[attempt] if attempt < len(RETRY_BACKOFF) else RETRY_BACKOFF[-1]
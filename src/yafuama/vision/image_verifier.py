@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import logging
 from typing import Any
@@ -65,8 +66,12 @@ class ImageVerifier:
             False: Different product
             None: Could not determine (fetch/API error) — caller should allow through
         """
-        img_a = await self._fetch_image(image_url_a)
-        img_b = await self._fetch_image(image_url_b)
+        # Independent hosts (Yahoo / Amazon CDN) — fetch both concurrently.
+        # _fetch_image never raises, so a failed side simply comes back as None.
+        img_a, img_b = await asyncio.gather(
+            self._fetch_image(image_url_a),
+            self._fetch_image(image_url_b),
+        )
         if img_a is None or img_b is None:
             logger.warning("Image fetch failed — skipping verification")
             return None
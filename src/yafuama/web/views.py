@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
+from typing import Any
 
 from datetime import datetime, timezone
 
+import orjson
 from fastapi import APIRouter, Body, Depends, Query, Request
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.templating import Jinja2Templates
-from sqlalchemy import func
+from sqlalchemy import case, func
 from sqlalchemy.orm import Session
 
 from ..database import get_db
@@ -30,8 +31,8 @@ def _checklist_complete(item: MonitoredItem) -> bool | None:
     if item.amazon_listing_status != "active":
         return None
     try:
-        cl = json.loads(item.seller_central_checklist) if item.seller_central_checklist else {}
-    except (json.JSONDecodeError, TypeError):
+        cl = orjson.loads(item.seller_central_checklist) if item.seller_central_checklist else {}
+    except (orjson.JSONDecodeError, TypeError):
         cl = {}
     if not cl:
         return False
@@ -40,7 +41,15 @@ def _checklist_complete(item: MonitoredItem) -> bool | None:
 
 templates.env.globals["checklist_complete"] = _checklist_complete
 
-router = APIRouter(tags=["web"])
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered straight to bytes with orjson (UI edit endpoints)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+router = APIRouter(tags=["web"], default_response_class=ORJSONResponse)
 
 
 # --- Full pages ---
@@ -50,13 +59,25 @@ router = APIRouter(tags=["web"])
 def dashboard(request: Request, db: Session = Depends(get_db)):
     from ..main import app_state
 
-    items = db.query(MonitoredItem).order_by(MonitoredItem.created_at.desc()).all()
+    # Counts in one aggregate query; only the 10 rows shown are materialized
+    total, active, sold, amazon_listed = db.query(
+        func.count(MonitoredItem.id),
+        func.count(case((MonitoredItem.status == "active", 1))),
+        func.count(case((MonitoredItem.status == "ended_sold", 1))),
+        func.count(case((MonitoredItem.amazon_listing_status == "active", 1))),
+    ).one()
     stats = {
-        "total": len(items),
-        "active": sum(1 for i in items if i.status == "active"),
-        "sold": sum(1 for i in items if i.status == "ended_sold"),
-        "amazon_listed": sum(1 for i in items if i.amazon_listing_status == "active"),
+        "total": total,
+        "active": active,
+        "sold": sold,
+        "amazon_listed": amazon_listed,
     }
+    recent_items = (
+        db.query(MonitoredItem)
+        .order_by(MonitoredItem.created_at.desc())
+        .limit(10)
+        .all()
+    )
     scheduler = app_state.get("scheduler")
 
     # Deal scanner stats
@@ -97,7 +118,7 @@ def dashboard(request: Request, db: Session = Depends(get_db)):
         "request": request,
         "active_page": "dashboard",
         "stats": stats,
-        "recent_items": items[:10],
+        "recent_items": recent_items,
         "scheduler_running": scheduler is not None and scheduler.running,
         "scanner_stats": scanner_stats,
         "recent_deals": recent_deals,
@@ -137,8 +158,8 @@ def item_detail(request: Request, auction_id: str, db: Session = Depends(get_db)
     )
     # Parse checklist JSON
     try:
-        checklist = json.loads(item.seller_central_checklist) if item.seller_central_checklist else {}
-    except (json.JSONDecodeError, TypeError):
+        checklist = orjson.loads(item.seller_central_checklist) if item.seller_central_checklist else {}
+    except (orjson.JSONDecodeError, TypeError):
         checklist = {}
     # Ensure all keys present
     for k in ("lead_time", "images", "condition"):
@@ -149,7 +170,7 @@ def item_detail(request: Request, auction_id: str, db: Session = Depends(get_db)
         "active_page": "items",
         "item": item,
         "history": history,
-        "checklist_json": json.dumps(checklist),
+        "checklist_json": orjson.dumps(checklist).decode(),
     })
 
 
@@ -195,12 +216,16 @@ def keywords_page(request: Request, db: Session = Depends(get_db)):
         .limit(50)
         .all()
     )
-    # Mark alerts that are already monitored
+    # Mark alerts that are already monitored (only the displayed auctions)
+    alert_auction_ids = {a.yahoo_auction_id for a in recent_alerts}
     monitored_auction_ids = {
         row[0] for row in db.query(MonitoredItem.auction_id)
-        .filter(MonitoredItem.amazon_sku.isnot(None))
+        .filter(
+            MonitoredItem.auction_id.in_(alert_auction_ids),
+            MonitoredItem.amazon_sku.isnot(None),
+        )
         .all()
-    }
+    } if alert_auction_ids else set()
     for alert in recent_alerts:
         alert.is_listed = alert.yahoo_auction_id in monitored_auction_ids
     scanner = app_state.get("deal_scanner")
@@ -255,8 +280,10 @@ def health_partial(request: Request, db: Session = Depends(get_db)):
     from ..main import app_state
 
     scheduler = app_state.get("scheduler")
-    total = db.query(MonitoredItem).count()
-    active = db.query(MonitoredItem).filter(MonitoredItem.is_monitoring_active == True).count()  # noqa: E712
+    total, active = db.query(
+        func.count(MonitoredItem.id),
+        func.count(case((MonitoredItem.is_monitoring_active == True, 1))),  # noqa: E712
+    ).one()
     health = {
         "scheduler_running": scheduler is not None and scheduler.running,
         "monitored_count": total,
@@ -439,7 +466,8 @@ async def deals_result_partial(
                 continue
 
             result = match_products(yahoo_title, amazon_title)
-            if not result.is_likely_match:
+            # A weaker match can never replace the current best, so skip scoring it
+            if not result.is_likely_match or result.score <= best_score:
                 continue
 
             deal = score_deal(
@@ -450,7 +478,7 @@ async def deals_result_partial(
                 amazon_fee_pct=settings.deal_amazon_fee_pct,
                 good_rank_threshold=settings.keepa_good_rank_threshold,
             )
-            if deal and result.score > best_score:
+            if deal:
                 # Price ratio sanity check: if Yahoo < 25% of Amazon,
                 # it's likely an accessory/part, not the real product
                 if deal.sell_price > 0 and yahoo_price < deal.sell_price * 0.25:
@@ -503,11 +531,11 @@ def set_asin(
     """Set ASIN and cost parameters on an item (called from item detail UI)."""
     item = db.query(MonitoredItem).filter(MonitoredItem.auction_id == auction_id).first()
     if not item:
-        return JSONResponse({"detail": "Item not found"}, status_code=404)
+        return ORJSONResponse({"detail": "Item not found"}, status_code=404)
 
     asin = data.get("asin", "").strip()
     if not asin:
-        return JSONResponse({"detail": "ASIN is required"}, status_code=400)
+        return ORJSONResponse({"detail": "ASIN is required"}, status_code=400)
 
     item.amazon_asin = asin
     if "estimated_win_price" in data:
@@ -516,7 +544,7 @@ def set_asin(
         item.shipping_cost = int(data["shipping_cost"])
     item.updated_at = datetime.now(timezone.utc)
     db.commit()
-    return JSONResponse({"ok": True})
+    return ORJSONResponse({"ok": True})
 
 
 class _Namespace:
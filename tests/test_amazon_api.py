@@ -1,6 +1,6 @@
 """Tests for Amazon API endpoints."""
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -9,6 +9,8 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from yafuama.amazon import AmazonApiError
+from yafuama.amazon.client import SpApiClient
+from yafuama.amazon.listing import ListingParams, submit_to_amazon
 from yafuama.database import Base, get_db
 from yafuama.main import app, app_state
 from yafuama.schemas import AuctionData
@@ -411,28 +413,30 @@ class TestSpApiNotConfigured:
         app_state.clear()
 
 
+@pytest.fixture()
+async def sp_api_client():
+    """SpApiClient with dummy credentials (no network); its pool is shut down after."""
+    with patch("yafuama.amazon.client.settings") as mock_settings:
+        mock_settings.sp_api_refresh_token = "test"
+        mock_settings.sp_api_lwa_app_id = "test"
+        mock_settings.sp_api_lwa_client_secret = "test"
+        mock_settings.sp_api_aws_access_key = "test"
+        mock_settings.sp_api_aws_secret_key = "test"
+        mock_settings.sp_api_role_arn = "test"
+        mock_settings.sp_api_marketplace = "A1VC38T7YXB528"
+        mock_settings.sp_api_seller_id = "SELLER1"
+        mock_settings.sp_api_pool_size = 4
+        client = SpApiClient()
+    yield client
+    await client.close()
+
+
 class TestGetReferralFeePct:
     """Tests for SpApiClient.get_referral_fee_pct()."""
 
-    def _make_client(self):
-        from unittest.mock import patch, MagicMock
-        with patch("yafuama.amazon.client.settings") as mock_settings:
-            mock_settings.sp_api_refresh_token = "test"
-            mock_settings.sp_api_lwa_app_id = "test"
-            mock_settings.sp_api_lwa_client_secret = "test"
-            mock_settings.sp_api_aws_access_key = "test"
-            mock_settings.sp_api_aws_secret_key = "test"
-            mock_settings.sp_api_role_arn = "test"
-            mock_settings.sp_api_marketplace = "A1VC38T7YXB528"
-            mock_settings.sp_api_seller_id = "SELLER1"
-            from yafuama.amazon.client import SpApiClient
-            client = SpApiClient()
-        return client
-
     @pytest.mark.asyncio
-    async def test_returns_fee_pct_and_caches(self):
+    async def test_returns_fee_pct_and_caches(self, sp_api_client):
         """Should extract referral fee % from API response and cache it."""
-        client = self._make_client()
         fee_response = {
             "FeesEstimateResult": {
                 "Status": "Success",
@@ -447,44 +451,209 @@ class TestGetReferralFeePct:
                 },
             }
         }
-        client._call = AsyncMock(return_value=fee_response)
+        sp_api_client._call = AsyncMock(return_value=fee_response)
 
-        result = await client.get_referral_fee_pct("B001TEST", 25980)
+        result = await sp_api_client.get_referral_fee_pct("B001TEST", 25980)
 
         assert result == 15.0  # 3897 / 25980 * 100 = 15.0%
-        assert "B001TEST" in client._fee_cache
-        assert client._fee_cache["B001TEST"] == 15.0
+        assert "B001TEST" in sp_api_client._fee_cache
+        assert sp_api_client._fee_cache["B001TEST"] == 15.0
 
     @pytest.mark.asyncio
-    async def test_cache_hit_skips_api_call(self):
+    async def test_cache_hit_skips_api_call(self, sp_api_client):
         """Cached ASIN should not trigger another API call."""
-        client = self._make_client()
-        client._fee_cache["B002CACHED"] = 8.0
-        client._call = AsyncMock()
+        sp_api_client._fee_cache["B002CACHED"] = 8.0
+        sp_api_client._call = AsyncMock()
 
-        result = await client.get_referral_fee_pct("B002CACHED", 10000)
+        result = await sp_api_client.get_referral_fee_pct("B002CACHED", 10000)
 
         assert result == 8.0
-        client._call.assert_not_called()
+        sp_api_client._call.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(self, sp_api_client):
+        """A full cache drops only the least recently used ASIN."""
+        sp_api_client._fee_cache_max = 2
+        sp_api_client._fee_cache["B_OLD"] = 8.0
+        sp_api_client._fee_cache["B_HOT"] = 10.0
+        sp_api_client._call = AsyncMock(return_value={
+            "FeesEstimateResult": {"FeesEstimate": {"FeeDetailList": [
+                {"FeeType": "ReferralFee", "FeeAmount": {"Amount": 1500.0}},
+            ]}},
+        })
+
+        assert await sp_api_client.get_referral_fee_pct("B_OLD", 10000) == 8.0  # now most recent
+        assert await sp_api_client.get_referral_fee_pct("B_NEW", 10000) == 15.0
+
+        assert list(sp_api_client._fee_cache) == ["B_OLD", "B_NEW"]
 
     @pytest.mark.asyncio
-    async def test_api_error_returns_none(self):
+    async def test_api_error_returns_none(self, sp_api_client):
         """API error should return None (caller uses fallback)."""
-        client = self._make_client()
-        client._call = AsyncMock(side_effect=AmazonApiError("Throttled", 429))
+        sp_api_client._call = AsyncMock(side_effect=AmazonApiError("Throttled", 429))
 
-        result = await client.get_referral_fee_pct("B003ERROR", 10000)
+        result = await sp_api_client.get_referral_fee_pct("B003ERROR", 10000)
 
         assert result is None
-        assert "B003ERROR" not in client._fee_cache
+        assert "B003ERROR" not in sp_api_client._fee_cache
 
     @pytest.mark.asyncio
-    async def test_zero_price_returns_none(self):
+    async def test_zero_price_returns_none(self, sp_api_client):
         """Price of 0 should return None immediately."""
-        client = self._make_client()
-        client._call = AsyncMock()
+        sp_api_client._call = AsyncMock()
 
-        result = await client.get_referral_fee_pct("B004ZERO", 0)
+        result = await sp_api_client.get_referral_fee_pct("B004ZERO", 0)
 
         assert result is None
-        client._call.assert_not_called()
+        sp_api_client._call.assert_not_called()
+
+
+class TestGetProductType:
+    """Tests for SpApiClient.get_product_type() caching."""
+
+    @pytest.mark.asyncio
+    async def test_cached_after_first_lookup(self, sp_api_client):
+        sp_api_client._call = AsyncMock(
+            return_value={"productTypes": [{"productType": "SPACE_HEATER"}]},
+        )
+
+        assert await sp_api_client.get_product_type("B001") == "SPACE_HEATER"
+        assert await sp_api_client.get_product_type("B001") == "SPACE_HEATER"
+
+        sp_api_client._call.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_api_error_not_cached(self, sp_api_client):
+        sp_api_client._call = AsyncMock(side_effect=AmazonApiError("Throttled", 429))
+
+        assert await sp_api_client.get_product_type("B001") == "PRODUCT"
+        assert "B001" not in sp_api_client._product_type_cache
+
+
+class TestGetListingsBulk:
+    """get_listings_bulk fetches many SKUs with one search call."""
+
+    @pytest.mark.asyncio
+    async def test_missing_skus_map_to_none(self, sp_api_client):
+        sp_api_client._call = AsyncMock(return_value={"items": [{"sku": "SKU-A", "summaries": []}]})
+
+        result = await sp_api_client.get_listings_bulk("SELLER1", ["SKU-A", "SKU-B"])
+
+        assert result == {"SKU-A": {"sku": "SKU-A", "summaries": []}, "SKU-B": None}
+        kwargs = sp_api_client._call.call_args.kwargs
+        assert kwargs["identifiers"] == "SKU-A,SKU-B"
+        assert kwargs["identifiersType"] == "SKU"
+
+
+class TestSpApiClientReuse:
+    """sp_api sp_api_client objects are built once per worker thread, not per call."""
+
+    @pytest.mark.asyncio
+    async def test_api_object_reused_across_calls(self, sp_api_client):
+        built = []
+
+        class FakeApi:
+            def __init__(self, **kwargs):
+                built.append(kwargs)
+
+            def echo(self, value):
+                return value
+
+        assert await sp_api_client._run(FakeApi, "echo", 1) == 1
+        assert await sp_api_client._run(FakeApi, "echo", 2) == 2
+        assert len(built) == 1
+
+
+class TestFeedBatch:
+    """Batch feed helpers put every SKU into one JSON_LISTINGS_FEED."""
+
+    @pytest.mark.asyncio
+    async def test_price_batch_single_feed(self, sp_api_client):
+        sp_api_client._submit_json_feed = AsyncMock(return_value={"feedId": "1"})
+
+        await sp_api_client.submit_price_feed_batch("SELLER1", [("SKU-A", 1000), ("SKU-B", 2000)])
+
+        sp_api_client._submit_json_feed.assert_called_once()
+        messages = sp_api_client._submit_json_feed.call_args.args[0]["messages"]
+        assert [(m["messageId"], m["sku"]) for m in messages] == [(1, "SKU-A"), (2, "SKU-B")]
+        price = messages[1]["patches"][0]["value"][0]["our_price"][0]["schedule"][0]
+        assert price == {"value_with_tax": 2000}
+
+
+class TestPatchListingAll:
+    """patch_listing_all merges the provided attributes into one PATCH."""
+
+    @pytest.mark.asyncio
+    async def test_single_request_only_given_fields(self, sp_api_client):
+        sp_api_client._call = AsyncMock(return_value={"status": "ACCEPTED"})
+
+        await sp_api_client.patch_listing_all("SELLER1", "SKU-A", quantity=1, lead_time=4)
+
+        sp_api_client._call.assert_called_once()
+        paths = [p["path"] for p in sp_api_client._call.call_args.kwargs["body"]["patches"]]
+        assert paths == [
+            "/attributes/fulfillment_availability",
+            "/attributes/lead_time_to_ship_max_days",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_patch(self, sp_api_client):
+        sp_api_client._call = AsyncMock()
+
+        assert await sp_api_client.patch_listing_all("SELLER1", "SKU-A") == {}
+        sp_api_client._call.assert_not_called()
+
+    def test_offer_image_patches_capped(self):
+        patches = SpApiClient.offer_image_patches([f"https://x/{i}.jpg" for i in range(10)])
+        assert len(patches) == 6
+        assert patches[0]["path"] == "/attributes/main_offer_image_locator"
+        assert patches[-1]["path"] == "/attributes/other_offer_image_locator_5"
+
+
+class TestSubmitToAmazon:
+    """submit_to_amazon() PATCH sequence."""
+
+    @pytest.mark.asyncio
+    async def test_condition_note_patched_separately_from_images(self):
+        """A rejected image PATCH must not take the condition note down with it."""
+        sp_client = AsyncMock()
+        sp_client.patch_offer_images.side_effect = AmazonApiError("INVALID")
+        params = ListingParams(
+            seller_id="SELLER1", sku="SKU-A", asin="B001", price=5000,
+            condition="used_very_good", lead_time=4, shipping_template="default",
+            condition_note="動作確認済み", image_urls=["https://img.yahoo/a.jpg"],
+        )
+
+        with patch("yafuama.amazon.listing.asyncio.sleep", AsyncMock()), \
+                patch("yafuama.amazon.image_proxy.settings") as proxy_settings:
+            proxy_settings.s3_image_enabled = False
+            result = await submit_to_amazon(sp_client, params)
+
+        assert result.success
+        sp_client.patch_condition_note.assert_called_once_with("SELLER1", "SKU-A", "動作確認済み")
+        sp_client.patch_offer_images.assert_called_once_with(
+            "SELLER1", "SKU-A", ["https://img.yahoo/a.jpg"],
+        )
+        sp_client.patch_listing_all.assert_called_once()
+        sp_client.patch_listing_quantity.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rejected_price_quantity_patch_retried_separately(self):
+        """A rejected combined PATCH must not drop the quantity=1 activation."""
+        sp_client = AsyncMock()
+        sp_client.patch_listing_all.side_effect = AmazonApiError("INVALID")
+        sp_client.patch_listing_price.side_effect = AmazonApiError("INVALID")
+        params = ListingParams(
+            seller_id="SELLER1", sku="SKU-A", asin="B001", price=5000,
+            condition="used_very_good", lead_time=4, shipping_template="default",
+        )
+
+        with patch("yafuama.amazon.listing.asyncio.sleep", AsyncMock()):
+            result = await submit_to_amazon(sp_client, params)
+
+        assert result.success
+        sp_client.patch_listing_all.assert_called_once_with(
+            "SELLER1", "SKU-A", price_jpy=5000, quantity=1,
+        )
+        sp_client.patch_listing_price.assert_called_once_with("SELLER1", "SKU-A", 5000)
+        sp_client.patch_listing_quantity.assert_called_once_with("SELLER1", "SKU-A", 1)
@@ -2,10 +2,12 @@
 
 from dataclasses import dataclass
 from time import monotonic
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from yafuama.models import DealAlert
 from yafuama.monitor.deal_scanner import DealScanner
 
 
@@ -208,6 +210,17 @@ class TestMatchYahooToAmazon:
         assert result is not None
         assert result.amazon_asin == "B001"
 
+    @pytest.mark.asyncio
+    async def test_precomputed_amazon_models(self, scanner):
+        """Amazon models extracted once per product give the same match."""
+        yr = FakeYahooResult("y1", "Sony WH-1000XM5 ヘッドホン 中古", 15000, shipping_cost=0)
+        kp = _make_keepa_product("B001", "Sony WH-1000XM5 Wireless Headphones", 30000, model="WH-1000XM5")
+        amazon_models = scanner._extract_amazon_models(kp)
+        assert amazon_models == {"wh1000xm5"}
+        result = await scanner._match_yahoo_to_amazon(yr, kp, amazon_models)
+        assert result is not None
+        assert result.amazon_asin == "B001"
+
     @pytest.mark.asyncio
     async def test_hyphen_ignored_match(self, scanner):
         """WH-1000XM5 should match WH1000XM5."""
@@ -315,6 +328,21 @@ class TestGetPfProducts:
         assert "B002" not in asins
         assert "B003" in asins
 
+    @pytest.mark.asyncio
+    async def test_no_used_price_filtered(self, scanner):
+        """Products without a current used price can never score a deal."""
+        scanner._pf_cache = None
+        scanner._keepa.tokens_left = 500
+
+        products = [
+            _make_keepa_product("B001", "Has Used", used_price=15000),
+            _make_keepa_product("B002", "No Used", used_price=-1),
+        ]
+        scanner._keepa.product_finder = AsyncMock(return_value=products)
+
+        result = await scanner._get_pf_products()
+        assert [p["asin"] for p in result] == ["B001"]
+
     @pytest.mark.asyncio
     async def test_low_tokens_skip(self, scanner):
         """Should skip Product Finder when tokens are low."""
@@ -647,3 +675,49 @@ class TestShortModelBrandExclusion:
         # WH-1000XM5 = 9 chars > 7, short model guard doesn't apply
         result = await scanner._match_yahoo_to_amazon(yr, kp)
         assert result is not None
+
+
+class TestProcessDealInsert:
+    """DealAlert insert must skip duplicates on the (auction, ASIN) constraint."""
+
+    @staticmethod
+    def _deal(auction_id="y1", asin="B0TEST0001"):
+        return SimpleNamespace(
+            yahoo_auction_id=auction_id, amazon_asin=asin,
+            yahoo_title="Sony WH-1000XM5", yahoo_url="", yahoo_image_url=None,
+            amazon_title=None, yahoo_price=15000, yahoo_shipping=0,
+            sell_price=30000, gross_profit=8000, gross_margin_pct=26.7,
+            amazon_fee=3000, forwarding_cost=1000,
+        )
+
+    @pytest.mark.asyncio
+    async def test_alert_saved(self, scanner, db):
+        result = await scanner._process_deal(self._deal(), "wh-1000xm5", db)
+        assert result is not None
+        alert = db.query(DealAlert).one()
+        assert alert.amazon_fee_pct == 10.0
+        assert alert.status == "active"
+        assert alert.notified_at is not None
+
+    @pytest.mark.asyncio
+    async def test_recent_same_asin_skipped_unless_better(self, scanner, db):
+        db.add(DealAlert(yahoo_auction_id="y0", amazon_asin="B0TEST0001", gross_profit=7500))
+        db.flush()
+        assert await scanner._process_deal(self._deal(), "wh-1000xm5", db) is None
+
+        better = self._deal(auction_id="y2")
+        better.gross_profit = 9000
+        assert await scanner._process_deal(better, "wh-1000xm5", db) is not None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicate_skipped(self, scanner, db):
+        """A duplicate inserted after the dedup check is skipped, not raised."""
+        async def _insert_duplicate():
+            db.add(DealAlert(yahoo_auction_id="y1", amazon_asin="B0TEST0001"))
+            db.flush()
+            raise RuntimeError("no network")
+
+        scanner._scraper._client._get_client = AsyncMock(side_effect=_insert_duplicate)
+        result = await scanner._process_deal(self._deal(), "wh-1000xm5", db)
+        assert result is None
+        assert db.query(DealAlert).count() == 1
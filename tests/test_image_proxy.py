@@ -0,0 +1,98 @@
+"""Tests for the Yahoo → S3 image proxy."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from yafuama.amazon import image_proxy
+from yafuama.amazon.image_proxy import close_image_proxy_client, upload_images_to_s3
+
+JPEG = b"\xff\xd8\xff\xe0" + b"\x00" * 16
+
+
+class _FakeHttp:
+    """Stand-in for the shared httpx client that tracks in-flight GETs."""
+
+    def __init__(self, fail_urls=()):
+        self.fail_urls = set(fail_urls)
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get(self, url):
+        self.calls.append(url)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if url in self.fail_urls:
+                raise RuntimeError("CDN error")
+            resp = MagicMock()
+            resp.content = JPEG + url.encode()
+            resp.headers = {"content-type": "image/jpeg"}
+            return resp
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture()
+async def proxy():
+    """Enable S3 with concurrency 2; fake downloads and uploads."""
+    http = _FakeHttp()
+    uploads: list[str] = []
+
+    def fake_upload(image_bytes, key, content_type):
+        uploads.append(key)
+        return f"https://bucket.s3.ap-northeast-1.amazonaws.com/{key}"
+
+    with patch.object(image_proxy, "settings") as mock_settings, \
+            patch.object(image_proxy, "_get_http_client", return_value=http), \
+            patch.object(image_proxy, "_upload_to_s3", side_effect=fake_upload):
+        mock_settings.s3_image_enabled = True
+        mock_settings.image_proxy_concurrency = 2
+        image_proxy._uploaded_urls.clear()
+        yield http, uploads
+    await close_image_proxy_client()
+    image_proxy._uploaded_urls.clear()
+
+
+class TestUploadImagesToS3:
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded_across_listings(self, proxy):
+        """image_proxy_concurrency caps in-flight work across concurrent listings."""
+        http, _ = proxy
+        urls_a = [f"https://img.yahoo/a{i}.jpg" for i in range(5)]
+        urls_b = [f"https://img.yahoo/b{i}.jpg" for i in range(5)]
+
+        await asyncio.gather(
+            upload_images_to_s3(urls_a, "A1"),
+            upload_images_to_s3(urls_b, "B1"),
+        )
+
+        assert len(http.calls) == 10
+        assert http.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_image_falls_back_to_original_url(self, proxy):
+        http, uploads = proxy
+        http.fail_urls = {"https://img.yahoo/1.jpg"}
+        urls = [f"https://img.yahoo/{i}.jpg" for i in range(3)]
+
+        result = await upload_images_to_s3(urls, "A1")
+
+        assert result[1] == "https://img.yahoo/1.jpg"
+        assert "s3." in result[0] and "s3." in result[2]
+        assert len(uploads) == 2
+
+    @pytest.mark.asyncio
+    async def test_repeated_url_proxied_once(self, proxy):
+        http, uploads = proxy
+        urls = ["https://img.yahoo/a.jpg", "https://img.yahoo/b.jpg", "https://img.yahoo/a.jpg"]
+
+        result = await upload_images_to_s3(urls, "A1")
+
+        assert http.calls.count("https://img.yahoo/a.jpg") == 1
+        assert len(uploads) == 2
+        assert result[0] == result[2]
+        assert "s3." in result[0]
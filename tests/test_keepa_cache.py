@@ -3,6 +3,7 @@
 from time import monotonic
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
 
 from yafuama.keepa.client import KeepaClient
@@ -21,10 +22,10 @@ def keepa_client():
 
 
 def _mock_response(products):
-    """Create a mock HTTP response with synchronous .json()."""
+    """Create a mock HTTP response with a raw JSON body."""
     resp = MagicMock()
     resp.status_code = 200
-    resp.json.return_value = {"products": products, "tokensLeft": 99}
+    resp.content = orjson.dumps({"products": products, "tokensLeft": 99})
     return resp
 
 
@@ -0,0 +1,188 @@
+"""Tests for ListingSyncChecker (Seller Central delist / price sync)."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from yafuama.amazon import AmazonApiError, listing_sync
+from yafuama.amazon.listing_sync import ListingSyncChecker, _TokenBucket
+from yafuama.database import Base
+from yafuama.models import MonitoredItem, StatusHistory
+
+
+@pytest.fixture()
+def session_factory():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    with patch.object(listing_sync, "SessionLocal", factory):
+        yield factory
+
+
+@pytest.fixture()
+def sleep():
+    """Record backoff/pacing sleeps instead of waiting."""
+    with patch("yafuama.amazon.listing_sync.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        yield mock_sleep
+
+
+def _checker(get_listings_bulk) -> ListingSyncChecker:
+    client = MagicMock()
+    client.get_listings_bulk = AsyncMock(side_effect=get_listings_bulk)
+    return ListingSyncChecker(client)
+
+
+def _add_items(factory, skus, synced_at=None) -> None:
+    db = factory()
+    for sku in skus:
+        db.add(MonitoredItem(
+            auction_id=f"a-{sku}", title="T", url="https://page.auctions.yahoo.co.jp/x",
+            amazon_sku=sku, amazon_listing_status="active", amazon_price=1000,
+            estimated_win_price=300, shipping_cost=100, amazon_fee_pct=10.0,
+            amazon_last_synced_at=synced_at,
+        ))
+    db.commit()
+    db.close()
+
+
+def _status(factory, sku) -> str:
+    db = factory()
+    try:
+        return db.query(MonitoredItem).filter_by(amazon_sku=sku).one().amazon_listing_status
+    finally:
+        db.close()
+
+
+class TestTokenBucket:
+    @pytest.mark.asyncio
+    async def test_burst_then_paced(self, sleep):
+        with patch.object(listing_sync, "monotonic", return_value=100.0):
+            bucket = _TokenBucket(rate=5.0, burst=2)
+            await bucket.acquire()
+            await bucket.acquire()
+            sleep.assert_not_called()
+
+            await bucket.acquire()
+        sleep.assert_called_once_with(pytest.approx(0.2))
+
+    @pytest.mark.asyncio
+    async def test_pause_delays_next_acquire(self, sleep):
+        with patch.object(listing_sync, "monotonic", return_value=100.0):
+            bucket = _TokenBucket(rate=5.0, burst=5)
+            bucket.pause(3.0)
+            await bucket.acquire()
+        sleep.assert_called_once_with(pytest.approx(3.0))
+
+
+class TestFetchListings:
+    @pytest.mark.asyncio
+    async def test_throttle_retry_then_success(self, sleep):
+        checker = _checker([AmazonApiError("QuotaExceeded", 429), {"S1": {"sku": "S1"}}])
+
+        result = await checker._fetch_listings(["S1"])
+
+        assert result == {"S1": {"sku": "S1"}}
+        assert checker.client.get_listings_bulk.call_count == 2
+        assert checker._consecutive_throttle == 0
+        # The retry waited out the backoff pause (0.5s base + jitter)
+        assert sleep.call_count == 1
+        assert 0.3 <= sleep.call_args.args[0] <= 0.8
+
+    @pytest.mark.asyncio
+    async def test_persistent_throttle_treated_as_exists(self, sleep):
+        checker = _checker(AmazonApiError("QuotaExceeded", 429))
+
+        result = await checker._fetch_listings(["S1", "S2"])
+
+        assert result == {"S1": {}, "S2": {}}
+        assert checker.client.get_listings_bulk.call_count == listing_sync._THROTTLE_RETRIES + 1
+
+    @pytest.mark.asyncio
+    async def test_other_error_treated_as_exists_without_retry(self, sleep):
+        checker = _checker(AmazonApiError("Internal error", 500))
+
+        assert await checker._fetch_listings(["S1"]) == {"S1": {}}
+        checker.client.get_listings_bulk.assert_called_once()
+
+
+class TestCheckAll:
+    @pytest.mark.asyncio
+    async def test_absent_sku_delisted_after_second_miss(self, session_factory, sleep):
+        skus = [f"S{i}" for i in range(25)]
+        _add_items(session_factory, skus)
+
+        async def bulk(seller_id, batch):
+            return {sku: (None if sku == "S3" else {"sku": sku}) for sku in batch}
+
+        checker = _checker(bulk)
+
+        await checker.check_all()
+        # Batches of 20: one call for S0-S19, one for S20-S24
+        assert [len(c.args[1]) for c in checker.client.get_listings_bulk.call_args_list] == [20, 5]
+        assert _status(session_factory, "S3") == "active"  # first miss only
+
+        await checker.check_all()
+        assert _status(session_factory, "S3") == "delisted"
+        assert _status(session_factory, "S4") == "active"
+
+        db = session_factory()
+        history = db.query(StatusHistory).all()
+        db.close()
+        assert [(h.auction_id, h.change_type) for h in history] == [("a-S3", "amazon_delist")]
+
+    @pytest.mark.asyncio
+    async def test_throttled_batch_not_delisted(self, session_factory, sleep):
+        _add_items(session_factory, ["S1"])
+        checker = _checker(AmazonApiError("QuotaExceeded", 429))
+
+        await checker.check_all()
+        await checker.check_all()
+
+        assert _status(session_factory, "S1") == "active"
+
+    @pytest.mark.asyncio
+    async def test_recently_synced_listing_skipped(self, session_factory, sleep):
+        now = datetime.now(timezone.utc)
+        _add_items(session_factory, ["FRESH"], synced_at=now)
+        _add_items(session_factory, ["STALE"], synced_at=now - timedelta(hours=1))
+        _add_items(session_factory, ["NEVER"])
+
+        async def bulk(seller_id, batch):
+            return {sku: {"sku": sku} for sku in batch}
+
+        checker = _checker(bulk)
+        await checker.check_all()
+
+        checker.client.get_listings_bulk.assert_called_once()
+        assert sorted(checker.client.get_listings_bulk.call_args.args[1]) == ["NEVER", "STALE"]
+
+    @pytest.mark.asyncio
+    async def test_price_changes_synced(self, session_factory, sleep):
+        _add_items(session_factory, ["S1", "S2", "S3"])
+
+        async def bulk(seller_id, batch):
+            prices = {"S1": 1200, "S2": 1000, "S3": 1500}  # S2 unchanged
+            return {sku: {"summaries": [{"price": {"amount": prices[sku]}}]} for sku in batch}
+
+        await _checker(bulk).check_all()
+
+        db = session_factory()
+        items = {i.amazon_sku: i for i in db.query(MonitoredItem).all()}
+        history = db.query(StatusHistory).order_by(StatusHistory.auction_id).all()
+        db.close()
+        assert items["S1"].amazon_price == 1200
+        assert items["S3"].amazon_price == 1500
+        assert items["S2"].amazon_last_synced_at is None  # untouched
+        # (1 - 400/1200 - 0.10) * 100
+        assert items["S1"].amazon_margin_pct == pytest.approx(56.7)
+        assert [(h.auction_id, h.old_price, h.new_price) for h in history] == [
+            ("a-S1", 1000, 1200), ("a-S3", 1000, 1500),
+        ]
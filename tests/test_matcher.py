@@ -4,6 +4,7 @@ import pytest
 
 from yafuama.matcher import (
     MatchResult,
+    _canonical_title_tokens,
     _canonicalize_tokens,
     _extract_model_numbers,
     _insert_boundary_spaces,
@@ -15,6 +16,7 @@ from yafuama.matcher import (
     match_products,
     normalize,
     tokenize,
+    tokenize_title,
 )
 
 
@@ -95,6 +97,16 @@ class TestTokenize:
         tokens = tokenize("a【b】「c」")
         assert tokens == ["a", "b", "c"]
 
+    def test_extractors_share_title_tokenization(self):
+        title = "ソニー WH-1000XM4 ワイヤレスヘッドホン"
+        _canonical_title_tokens.cache_clear()
+        extract_accessory_signals_from_text(title)
+        extract_model_numbers_from_text(title)
+        tokenize_title(title)
+        info = _canonical_title_tokens.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
 
 class TestSplitKnownBrands:
     def test_splits_concatenated_brand(self):
@@ -421,6 +433,7 @@ class TestAccessoryDetectionInvariant:
         ("ECAM35015BH 互換 フィルター", True),
         ("WH-1000XM5 イヤーパッド のみ", True),
         ("WH-1000XM5 収納 ケース", True),
+        ("HERO12 防水ケース", True),             # katakana entry folded to hiragana
         # Main products should NOT trigger
         ("Sony WH-1000XM5 ヘッドホン", False),
         ("Dyson SV18FF 掃除機 コードレス", False),
@@ -0,0 +1,225 @@
+"""Tests for OrderMonitor (Amazon new-order notifications)."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from yafuama.amazon import AmazonApiError, order_monitor
+from yafuama.amazon.order_monitor import OrderMonitor
+from yafuama.database import Base
+from yafuama.models import AmazonOrder, MonitoredItem
+
+
+@pytest.fixture()
+def engine():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _fk_on(dbapi_conn, connection_record):
+        dbapi_conn.execute("PRAGMA foreign_keys=ON")  # same as database.py
+
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+@pytest.fixture()
+def session_factory(engine):
+    factory = sessionmaker(bind=engine, autoflush=False)
+    with patch.object(order_monitor, "SessionLocal", factory):
+        yield factory
+
+
+@pytest.fixture()
+def webhook():
+    with patch.object(order_monitor, "send_webhook", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = True
+        yield mock_send
+
+
+@pytest.fixture()
+def monitor(session_factory):
+    client = MagicMock()
+    client.get_new_orders = AsyncMock(return_value=[])
+    client.get_order_items = AsyncMock(return_value=[])
+    return OrderMonitor(client, "https://discord.com/api/webhooks/x")
+
+
+@pytest.fixture()
+def item_queries(engine):
+    """Count SELECTs against monitored_items."""
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT") and "FROM monitored_items" in statement:
+            statements.append(statement)
+
+    return statements
+
+
+def _add_item(factory, sku, asin="", title="Item", auction_id="") -> int:
+    db = factory()
+    item = MonitoredItem(
+        auction_id=auction_id or f"a-{sku}", title=title, url=f"https://page.auctions.yahoo.co.jp/{sku}",
+        amazon_sku=sku, amazon_asin=asin or None,
+    )
+    db.add(item)
+    db.commit()
+    item_id = item.id
+    db.close()
+    return item_id
+
+
+def _orders(factory) -> dict[str, AmazonOrder]:
+    db = factory()
+    try:
+        return {o.amazon_order_id: o for o in db.query(AmazonOrder).all()}
+    finally:
+        db.close()
+
+
+def _checkpoint(factory) -> str | None:
+    db = factory()
+    try:
+        row = db.execute(text("SELECT value FROM app_state WHERE key = :k"),
+                         {"k": order_monitor._CHECKPOINT_KEY}).first()
+        return row[0] if row else None
+    finally:
+        db.close()
+
+
+class TestCheckOrders:
+    @pytest.mark.asyncio
+    async def test_shared_sku_resolved_with_one_query(
+        self, monitor, session_factory, webhook, item_queries,
+    ):
+        item_id = _add_item(session_factory, "SKU-1", title="Camera")
+        monitor.client.get_new_orders.return_value = [
+            {"AmazonOrderId": "O1"}, {"AmazonOrderId": "O2"},
+        ]
+        monitor.client.get_order_items.return_value = [{"SellerSKU": "SKU-1"}]
+        item_queries.clear()
+
+        await monitor.check_orders()
+
+        assert len(item_queries) == 1
+        assert webhook.call_count == 2
+        orders = _orders(session_factory)
+        assert orders["O1"].item_id == item_id and orders["O2"].item_id == item_id
+        assert orders["O1"].title == "Camera"
+        assert monitor._seen_order_ids >= {"O1", "O2"}
+
+    @pytest.mark.asyncio
+    async def test_order_items_error_does_not_block_other_orders(
+        self, monitor, session_factory, webhook,
+    ):
+        item_id = _add_item(session_factory, "SKU-1")
+        monitor.client.get_new_orders.return_value = [
+            {"AmazonOrderId": "O1"}, {"AmazonOrderId": "O2"},
+        ]
+
+        async def order_items(order_id):
+            if order_id == "O1":
+                raise ValueError("malformed payload")
+            return [{"SellerSKU": "SKU-1"}]
+
+        monitor.client.get_order_items.side_effect = order_items
+
+        await monitor.check_orders()
+
+        assert webhook.call_count == 2
+        orders = _orders(session_factory)
+        assert orders["O1"].item_id is None  # notified without product info
+        assert orders["O2"].item_id == item_id
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_advanced_only_when_all_notified(
+        self, monitor, session_factory, webhook,
+    ):
+        before = monitor._last_checked_at
+        monitor.client.get_new_orders.return_value = [{"AmazonOrderId": "O1"}]
+        webhook.return_value = False
+
+        await monitor.check_orders()
+
+        assert monitor._last_checked_at == before
+        assert "O1" not in monitor._seen_order_ids
+
+        webhook.return_value = True
+        await monitor.check_orders()
+
+        assert monitor._last_checked_at != before
+        assert _checkpoint(session_factory) == monitor._last_checked_at
+        assert "O1" in monitor._seen_order_ids
+
+    @pytest.mark.asyncio
+    async def test_item_load_failure_retries_all_orders(self, monitor, session_factory, webhook):
+        before = monitor._last_checked_at
+        monitor.client.get_new_orders.return_value = [{"AmazonOrderId": "O1"}]
+
+        with patch.object(monitor, "_load_monitored_items", side_effect=RuntimeError("db locked")):
+            await monitor.check_orders()
+
+        webhook.assert_not_called()
+        assert monitor._last_checked_at == before
+        assert "O1" not in monitor._seen_order_ids
+
+    @pytest.mark.asyncio
+    async def test_orders_api_error_keeps_checkpoint(self, monitor, webhook):
+        before = monitor._last_checked_at
+        monitor.client.get_new_orders.side_effect = AmazonApiError("Throttled", 429)
+
+        await monitor.check_orders()
+
+        webhook.assert_not_called()
+        assert monitor._last_checked_at == before
+
+    @pytest.mark.asyncio
+    async def test_item_deleted_between_cycles(
+        self, monitor, session_factory, webhook,
+    ):
+        """A stale item_id would fail the FK check and lose the order record."""
+        _add_item(session_factory, "SKU-1")
+        monitor.client.get_order_items.return_value = [{"SellerSKU": "SKU-1"}]
+        monitor.client.get_new_orders.return_value = [{"AmazonOrderId": "O1"}]
+        await monitor.check_orders()
+
+        db = session_factory()
+        db.query(AmazonOrder).delete()
+        db.query(MonitoredItem).delete()
+        db.commit()
+        db.close()
+
+        monitor.client.get_new_orders.return_value = [{"AmazonOrderId": "O2"}]
+        await monitor.check_orders()
+
+        orders = _orders(session_factory)
+        assert "O2" in orders
+        assert orders["O2"].item_id is None
+
+    @pytest.mark.asyncio
+    async def test_sku_moved_to_another_item_between_cycles(
+        self, monitor, session_factory, webhook,
+    ):
+        old_id = _add_item(session_factory, "SKU-1", title="Old")
+        monitor.client.get_order_items.return_value = [{"SellerSKU": "SKU-1"}]
+        monitor.client.get_new_orders.return_value = [{"AmazonOrderId": "O1"}]
+        await monitor.check_orders()
+
+        db = session_factory()
+        db.get(MonitoredItem, old_id).amazon_sku = "SKU-OLD"
+        db.commit()
+        db.close()
+        new_id = _add_item(session_factory, "SKU-1", title="New", auction_id="a-new")
+
+        monitor.client.get_new_orders.return_value = [{"AmazonOrderId": "O2"}]
+        await monitor.check_orders()
+
+        assert _orders(session_factory)["O2"].item_id == new_id
@@ -4,16 +4,20 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from yafuama.notifier.webhook import LINE_NOTIFY_URL, WebhookNotifier, send_webhook
+from yafuama.notifier.webhook import (
+    LINE_NOTIFY_URL,
+    WebhookNotifier,
+    _get_client,
+    close_webhook_client,
+    send_webhook,
+)
 
 
 class TestSendWebhook:
     @pytest.mark.asyncio
     async def test_json_post_discord(self):
-        with patch("yafuama.notifier.webhook.httpx.AsyncClient") as mock_cls:
-            mock_client = AsyncMock()
-            mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_client = AsyncMock()
+        with patch("yafuama.notifier.webhook._get_client", return_value=mock_client):
             mock_resp = AsyncMock()
             mock_resp.raise_for_status = lambda: None
             mock_client.post.return_value = mock_resp
@@ -31,10 +35,8 @@ class TestSendWebhook:
 
     @pytest.mark.asyncio
     async def test_form_post_line(self):
-        with patch("yafuama.notifier.webhook.httpx.AsyncClient") as mock_cls:
-            mock_client = AsyncMock()
-            mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_client = AsyncMock()
+        with patch("yafuama.notifier.webhook._get_client", return_value=mock_client):
             mock_resp = AsyncMock()
             mock_resp.raise_for_status = lambda: None
             mock_client.post.return_value = mock_resp
@@ -52,10 +54,8 @@ class TestSendWebhook:
 
     @pytest.mark.asyncio
     async def test_retry_on_failure(self):
-        with patch("yafuama.notifier.webhook.httpx.AsyncClient") as mock_cls:
-            mock_client = AsyncMock()
-            mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_client = AsyncMock()
+        with patch("yafuama.notifier.webhook._get_client", return_value=mock_client):
             mock_client.post.side_effect = Exception("connection error")
 
             with patch("yafuama.notifier.webhook.asyncio.sleep", new_callable=AsyncMock):
@@ -68,6 +68,16 @@ class TestSendWebhook:
             assert result is False
             assert mock_client.post.call_count == 3
 
+    @pytest.mark.asyncio
+    async def test_client_shared_until_closed(self):
+        client = _get_client()
+        assert _get_client() is client
+        await close_webhook_client()
+        assert client.is_closed
+        new_client = _get_client()
+        assert new_client is not client
+        await close_webhook_client()
+
 
 class TestWebhookNotifierPayload:
     def test_discord_payload(self):